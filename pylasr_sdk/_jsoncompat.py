@@ -0,0 +1,31 @@
+"""
+JSON encode/decode helpers shared by the input and output types. `orjson`
+is used when it is installed, otherwise these fall back to the standard
+library `json` module. Both produce compact output with no whitespace
+and write non-ASCII characters as raw UTF-8 rather than `\\u` escapes.
+"""
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+    loads = orjson.loads
+    dumps_bytes = orjson.dumps
+
+    def dumps(obj) -> str:
+        """Serializes `obj` into a JSON string"""
+        return orjson.dumps(obj).decode()
+else:
+    loads = json.loads
+
+    def dumps(obj) -> str:
+        """Serializes `obj` into a JSON string"""
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+    def dumps_bytes(obj) -> bytes:
+        """Serializes `obj` into UTF-8 encoded JSON bytes"""
+        return dumps(obj).encode("utf-8")
@@ -1,36 +1,83 @@
-import json
+import sys
+from functools import lru_cache
 from typing import (
     Union,
     Dict,
-    Set,
-    List
+    List,
+    Tuple
 )
+from _jsoncompat import loads, dumps_bytes
 from outputs import (
     Address,
     AddressOrNamespace,
     U256,
+    address_from_hex,
+    u256_from_hex,
 )
 
 
+_VALID_STATES = frozenset(("free", "locked"))
+
+_VALID_ACCOUNT_KINDS = frozenset(("user", "program"))
+
+_VALID_TRANSACTION_KINDS = frozenset((
+    "bridgeIn",
+    "send",
+    "call",
+    "bridgeOut",
+    "registerProgram"
+))
+
+
+def _address_from_json(value: Union[str, List[int]]) -> Address:
+    """Decodes an address given either as a hex string or as a byte array"""
+    if isinstance(value, str):
+        return address_from_hex(value)
+
+    return Address(value)
+
+
+def _as_dict(map: Union[str, bytes, dict]):
+    """Parses `map` as JSON unless it has already been decoded into a dict"""
+    if isinstance(map, dict):
+        return map
+
+    return loads(map)
+
+
+@lru_cache(maxsize=1024)
+def _transaction_type_item(map: Union[str, bytes]) -> Tuple[str, str]:
+    """Parses a serialized TransactionType into its `(kind, nonce)` pair,
+    repeated payloads are only parsed once"""
+    return next(iter(loads(map).items()))
+
+
 class Status:
     """
     A type that denotes the status of a token, whether it can be 'used',
     i.e. have its state altered.
     """
 
+    __slots__ = ("state",)
+
     def __init__(self, state: str):
-        valid_states = ["free", "locked"]
+        if state not in _VALID_STATES:
+            raise ValueError(
+                f"expected `state` to be one of {sorted(_VALID_STATES)}"
+            )
 
-        if state not in valid_states:
-            raise ValueError
+        self.state = sys.intern(state)
 
-        self.state = state
+    @staticmethod
+    def from_json(map: Union[str, bytes, dict]):
+        return Status.from_dict(_as_dict(map))
 
     @staticmethod
-    def from_json(map: str):
-        json_status = json.loads(map)
+    def from_dict(json_status: Union[str, dict]):
+        if isinstance(json_status, str):
+            return Status(json_status)
 
-        state = json_status.values()[0]
+        state = next(iter(json_status.values()))
 
         return Status(state)
 
@@ -41,32 +88,48 @@ class Status:
 class Token:
     """
     a type representing a canonical `Token` in the protocol
+
+    The result of `to_dict` is built once and cached, fields should not be
+    modified after the first call to `to_dict`.
     """
 
+    __slots__ = (
+        "program_id",
+        "owner_id",
+        "balance",
+        "metadata",
+        "token_ids",
+        "allowance",
+        "approvals",
+        "data",
+        "status",
+        "_dict",
+    )
+
     def __init__(
         self,
         program_id: Address,
         owner_id: Address,
         balance: U256,
         metadata: Dict[str, str],
-        token_ids: List[U256],
+        token_ids: Tuple[str, ...],
         allowance: Dict[Address, U256],
         approvals: Dict[Address, List[U256]],
         data: Dict[str, str],
         status: Status
     ):
 
-        if not all(
+        if not all((
             isinstance(program_id, Address),
             isinstance(owner_id, Address),
             isinstance(balance, U256),
-            isinstance(metadata, Dict[str, str]),
-            isinstance(token_ids, List[U256]),
-            isinstance(allowance, Dict[Address, U256]),
-            isinstance(approvals, Dict[Address, List[U256]]),
-            isinstance(data, Dict[str, str]),
+            isinstance(metadata, dict),
+            isinstance(token_ids, (tuple, list)),
+            isinstance(allowance, dict),
+            isinstance(approvals, dict),
+            isinstance(data, dict),
             isinstance(status, Status),
-        ):
+        )):
             raise ValueError
 
         self.program_id = program_id
@@ -78,69 +141,96 @@ class Token:
         self.approvals = approvals
         self.data = data
         self.status = status
+        self._dict = None
 
     @staticmethod
-    def from_json(map: str):
-        json_token = json.loads(map)
-        program_id = Address.from_hex(json_token["programId"])
-        owner_id = Address.from_hex(json_token["ownerId"])
-        balance = U256.from_hex(json_token["balance"])
-        metadata = json.loads(json_token["metadata"])
-        token_ids = list(json_token["tokenIds"])
-        allowance = json.loads(json_token["allowance"])
-        approvals = json.loads(json_token["approvals"])
-        data = json.loads(json_token["data"])
-        status = Status.from_json(json_token["status"])
+    def from_json(map: Union[str, bytes, dict]):
+        return Token.from_dict(_as_dict(map))
 
+    @staticmethod
+    def from_dict(json_token: dict):
         return Token(
-            program_id,
-            owner_id,
-            balance,
-            metadata,
-            token_ids,
-            allowance,
-            approvals,
-            data,
-            status
+            address_from_hex(json_token["programId"]),
+            address_from_hex(json_token["ownerId"]),
+            u256_from_hex(json_token["balance"]),
+            json_token["metadata"],
+            tuple(json_token["tokenIds"]),
+            json_token["allowance"],
+            json_token["approvals"],
+            json_token["data"],
+            Status.from_dict(json_token["status"])
         )
 
     def to_dict(self):
-        return {
-            "programId": self.program_id.to_dict(),
-            "ownerId": self.owner_id.to_dict(),
-            "balance": self.balance.to_dict(),
-            "metadata": self.metadata,
-            "tokenIds": self.token_ids,
-            "allowance": self.allowance,
-            "approvals": self.approvals,
-            "data": self.data,
-            "status": self.status.to_dict()
-        }
+        if self._dict is None:
+            self._dict = {
+                "programId": self.program_id.to_dict(),
+                "ownerId": self.owner_id.to_dict(),
+                "balance": self.balance.to_dict(),
+                "metadata": self.metadata,
+                "tokenIds": self.token_ids,
+                "allowance": self.allowance,
+                "approvals": self.approvals,
+                "data": self.data,
+                "status": self.status.to_dict()
+            }
+        return self._dict
+
+    def to_json_bytes(self) -> bytes:
+        """Serializes the Token into UTF-8 encoded JSON bytes"""
+        return dumps_bytes(self.to_dict())
 
 
 class AccountType:
-    def __init__(self, kind: str, value: Union[None, Address]):
-        valid_kinds = ["user", "program"]
+    __slots__ = ("kind", "value")
 
-        if kind not in valid_kinds:
-            return ValueError
+    def __init__(self, kind: str, value: Union[None, Address]):
+        if kind not in _VALID_ACCOUNT_KINDS:
+            raise ValueError
 
-        self.kind = kind
+        self.kind = sys.intern(kind)
         self.value = value
 
+    @staticmethod
+    def from_json(map: Union[str, bytes, dict]):
+        return AccountType.from_dict(_as_dict(map))
+
+    @staticmethod
+    def from_dict(json_account_type: Union[str, dict]):
+        if isinstance(json_account_type, str):
+            return AccountType(json_account_type, None)
+
+        kind, address = next(iter(json_account_type.items()))
+
+        return AccountType(kind, address_from_hex(address))
+
     def to_dict(self):
         if self.kind == "user":
             return "user"
 
-        if self.kind == "program":
-            return {"program": self.value.to_dict()}
+        return {"program": self.value.to_dict()}
 
 
 class Account:
     """
     A type representing the canonical `Account` type in the LASR protocol
+
+    The result of `to_dict` is built once and cached, fields should not be
+    modified after the first call to `to_dict`.
     """
 
+    __slots__ = (
+        "account_type",
+        "program_namespace",
+        "owner_address",
+        "programs",
+        "nonce",
+        "program_account_data",
+        "program_account_metadata",
+        "program_account_linked_programs",
+        "_dict",
+    )
+
     def __init__(
         self,
         account_type: AccountType,
@@ -150,21 +240,22 @@ class Account:
         nonce: U256,
         program_account_data: Dict[str, str],
         program_account_metadata: Dict[str, str],
-        program_account_linked_programs: Set[AddressOrNamespace]
+        program_account_linked_programs: Tuple[AddressOrNamespace, ...]
     ):
 
-        if not all(
+        if not all((
             isinstance(account_type, AccountType),
             isinstance(program_namespace, AddressOrNamespace),
             isinstance(owner_address, Address),
-            isinstance(programs, Dict[Address, Token]),
+            isinstance(programs, dict),
             isinstance(nonce, U256),
-            isinstance(program_account_data, Dict[str, str]),
-            isinstance(program_account_metadata, Dict[str, str]),
+            isinstance(program_account_data, dict),
+            isinstance(program_account_metadata, dict),
             isinstance(
-                program_account_linked_programs, Set[AddressOrNamespace]
+                program_account_linked_programs,
+                (tuple, list, set, frozenset)
             ),
-        ):
+        )):
             raise ValueError
 
         self.account_type = account_type
@@ -174,37 +265,37 @@ class Account:
         self.nonce = nonce
         self.program_account_data = program_account_data
         self.program_account_metadata = program_account_metadata
-        self.program_account_linked_programs = program_account_linked_programs
+        self.program_account_linked_programs = tuple(
+            program_account_linked_programs
+        )
+        self._dict = None
 
     @staticmethod
-    def from_json(map: str):
-        json_account = json.loads(map)
+    def from_json(map: Union[str, bytes, dict]):
+        return Account.from_dict(_as_dict(map))
 
-        account_type = AccountType.from_json(json_account["accountType"])
+    @staticmethod
+    def from_dict(json_account: dict):
+        account_type = AccountType.from_dict(json_account["accountType"])
 
-        program_namespace = AddressOrNamespace.from_json(
+        program_namespace = AddressOrNamespace.from_dict(
             json_account["programNamespace"]
         )
 
-        owner_address = Address.from_hex(
-            json_account["ownerAddress"]
-        )
+        owner_address = address_from_hex(json_account["ownerAddress"])
 
-        programs = json.loads(json_account["programs"])
+        programs = json_account["programs"]
 
-        nonce = U256.from_hex(json_account["nonce"])
+        nonce = u256_from_hex(json_account["nonce"])
 
-        program_account_data = json.loads(
-            json_account["programAccountData"]
-        )
+        program_account_data = json_account["programAccountData"]
 
-        program_account_metadata = json.loads(
-            json_account["programAccountMetadata"]
-        )
+        program_account_metadata = json_account["programAccountMetadata"]
 
-        program_account_linked_programs = json.loads(
+        program_account_linked_programs = tuple(map(
+            AddressOrNamespace.from_dict,
             json_account["programAccountLinkedPrograms"]
-        )
+        ))
 
         return Account(
             account_type,
@@ -218,16 +309,46 @@ class Account:
         )
 
     def to_dict(self):
-        return {
-            "accountType": self.account_type.to_dict(),
-            "programNamespace": self.program_namespace.to_dict(),
-            "ownerAddress": self.owner_address.to_dict(),
-            "programs": self.programs,
-            "nonce": self.nonce.to_dict(),
-            "programAccountData": self.program_account_data,
-            "programAccountMetadata": self.program_account_metadata,
-            "programAccountLinkedPrograms": self.program_account_linked_programs
-        }
+        if self._dict is None:
+            self._dict = {
+                "accountType": self.account_type.to_dict(),
+                "programNamespace": self.program_namespace.to_dict(),
+                "ownerAddress": self.owner_address.to_dict(),
+                "programs": self.programs,
+                "nonce": self.nonce.to_dict(),
+                "programAccountData": self.program_account_data,
+                "programAccountMetadata": self.program_account_metadata,
+                "programAccountLinkedPrograms": list(map(
+                    AddressOrNamespace.to_dict,
+                    self.program_account_linked_programs
+                ))
+            }
+        return self._dict
+
+    def to_json_bytes(self) -> bytes:
+        """Serializes the Account into UTF-8 encoded JSON bytes"""
+        return dumps_bytes(self.to_dict())
+
+    def iter_programs(self):
+        """
+        Lazily yields `(Address, Token)` pairs from `programs`, decoding one
+        entry at a time instead of materializing every Token up front
+        """
+        for address, token in self.programs.items():
+            if not isinstance(address, Address):
+                address = address_from_hex(address)
+
+            if not isinstance(token, Token):
+                token = Token.from_dict(token)
+
+            yield address, token
+
+    def decode_programs(self) -> Dict[Address, Token]:
+        """
+        Decodes every entry of `programs` into a map of Address to Token,
+        entries that are already decoded are kept as they are
+        """
+        return dict(self.iter_programs())
 
 
 class TransactionType:
@@ -236,28 +357,29 @@ class TransactionType:
     protocol
     """
 
+    __slots__ = ("kind", "nonce")
+
     def __init__(self, kind: str, nonce: U256):
-        valid_kinds = [
-            "bridgeIn",
-            "send",
-            "call",
-            "bridgeOut",
-            "registerProgram"
-        ]
-
-        if kind not in valid_kinds:
+        if kind not in _VALID_TRANSACTION_KINDS:
             raise ValueError
 
-        self.kind = kind
+        self.kind = sys.intern(kind)
         self.nonce = nonce
 
     @staticmethod
-    def from_json(map: str):
-        json_transaction_type = json.loads(map)
-        kind = list(json_transaction_type.keys())[0]
-        nonce = U256.from_hex(list(json_transaction_type.values())[0])
+    def from_json(map: Union[str, bytes, dict]):
+        if isinstance(map, dict):
+            return TransactionType.from_dict(map)
 
-        return TransactionType(kind, nonce)
+        kind, nonce = _transaction_type_item(map)
+
+        return TransactionType(kind, u256_from_hex(nonce))
+
+    @staticmethod
+    def from_dict(json_transaction_type: dict):
+        kind, nonce = next(iter(json_transaction_type.items()))
+
+        return TransactionType(kind, u256_from_hex(nonce))
 
     def to_dict(self):
         return {
@@ -268,8 +390,29 @@ class TransactionType:
 class Transaction:
     """
     A type representing the canonical `Transaction` type in the LASR protocol
+
+    The result of `to_dict` is built once and cached, fields should not be
+    modified after the first call to `to_dict`.
+
+    The signature values `r` and `s` may be given as hex strings, they are
+    only decoded into a U256 the first time they are accessed.
     """
 
+    __slots__ = (
+        "transaction_type",
+        "caller",
+        "receiver",
+        "program_id",
+        "op",
+        "inputs",
+        "value",
+        "nonce",
+        "v",
+        "_r",
+        "_s",
+        "_dict",
+    )
+
     def __init__(
         self,
         transaction_type: TransactionType,
@@ -281,11 +424,11 @@ class Transaction:
         value: U256,
         nonce: U256,
         v: int,
-        r: U256,
-        s: U256,
+        r: Union[U256, str],
+        s: Union[U256, str],
     ):
 
-        if not all(
+        if not all((
             isinstance(transaction_type, TransactionType),
             isinstance(caller, Address),
             isinstance(receiver, Address),
@@ -295,9 +438,9 @@ class Transaction:
             isinstance(value, U256),
             isinstance(nonce, U256),
             isinstance(v, int),
-            isinstance(r, U256),
-            isinstance(s, U256)
-        ):
+            isinstance(r, (U256, str)),
+            isinstance(s, (U256, str))
+        )):
             raise ValueError
 
         self.transaction_type = transaction_type
@@ -309,62 +452,93 @@ class Transaction:
         self.value = value
         self.nonce = nonce
         self.v = v
-        self.r = r
-        self.s = s
+        self._r = r
+        self._s = s
+        self._dict = None
 
-    @staticmethod
-    def from_json(map: str):
-        json_transaction = json.loads(map)
+    # r and s are unique per signature, so they are decoded with
+    # U256.from_hex rather than through the shared u256_from_hex cache
+    @property
+    def r(self) -> U256:
+        if not isinstance(self._r, U256):
+            self._r = U256.from_hex(self._r)
 
-        transaction_type = TransactionType.from_json(
-            json_transaction["transactionType"]
-        )
-        caller = Address(list(json_transaction["from"]))
-        receiver = Address(list(json_transaction["to"]))
-        program_id = Address(list(json_transaction["programId"]))
-        op = json_transaction["op"]
-        inputs = json_transaction["trasnactionInputs"]
-        value = U256.from_hex(json_transaction["value"])
-        nonce = U256.from_hex(json_transaction["nonce"])
-        v = int(json_transaction["v"])
-        r = U256.from_hex(json_transaction["r"])
-        s = U256.from_hex(json_transaction["s"])
+        return self._r
+
+    @r.setter
+    def r(self, r: U256):
+        self._r = r
+
+    @property
+    def s(self) -> U256:
+        if not isinstance(self._s, U256):
+            self._s = U256.from_hex(self._s)
+
+        return self._s
 
+    @s.setter
+    def s(self, s: U256):
+        self._s = s
+
+    @staticmethod
+    def from_json(map: Union[str, bytes, dict]):
+        return Transaction.from_dict(_as_dict(map))
+
+    @staticmethod
+    def from_dict(json_transaction: dict):
         return Transaction(
-            transaction_type,
-            caller,
-            receiver,
-            program_id,
-            op,
-            inputs,
-            value,
-            nonce,
-            v,
-            r,
-            s
+            TransactionType.from_dict(json_transaction["transactionType"]),
+            _address_from_json(json_transaction["from"]),
+            _address_from_json(json_transaction["to"]),
+            _address_from_json(json_transaction["programId"]),
+            json_transaction["op"],
+            json_transaction["transactionInputs"],
+            u256_from_hex(json_transaction["value"]),
+            u256_from_hex(json_transaction["nonce"]),
+            int(json_transaction["v"]),
+            json_transaction["r"],
+            json_transaction["s"]
         )
 
     def to_dict(self):
-        return {
-            "transactionType": self.transaction_type.to_dict(),
-            "from": self.caller.to_dict(),
-            "to": self.receiver.to_dict(),
-            "programId": self.program_id.to_dict(),
-            "op": self.op,
-            "transactionInputs": self.inputs,
-            "value": self.value.to_dict(),
-            "nonce": self.nonce.to_dict(),
-            "v": self.v,
-            "r": self.r.to_dict(),
-            "s": self.s.to_dict()
-        }
+        if self._dict is None:
+            self._dict = {
+                "transactionType": self.transaction_type.to_dict(),
+                "from": self.caller.to_dict(),
+                "to": self.receiver.to_dict(),
+                "programId": self.program_id.to_dict(),
+                "op": self.op,
+                "transactionInputs": self.inputs,
+                "value": self.value.to_dict(),
+                "nonce": self.nonce.to_dict(),
+                "v": self.v,
+                "r": self.r.to_dict(),
+                "s": self.s.to_dict()
+            }
+        return self._dict
+
+    def to_json_bytes(self) -> bytes:
+        """Serializes the Transaction into UTF-8 encoded JSON bytes"""
+        return dumps_bytes(self.to_dict())
 
 
 class Inputs:
     """
     A type representing the canonical computeInputs type in the LASR protocol
+
+    The result of `to_dict` is built once and cached, fields should not be
+    modified after the first call to `to_dict`.
     """
 
+    __slots__ = (
+        "version",
+        "account_info",
+        "transaction",
+        "op",
+        "contract_inputs",
+        "_dict",
+    )
+
     def __init__(
         self,
         version: int,
@@ -374,13 +548,13 @@ class Inputs:
         contract_inputs: str
     ):
 
-        if not all(
+        if not all((
             isinstance(version, int),
             isinstance(account_info, Account),
             isinstance(transaction, Transaction),
             isinstance(op, str),
             isinstance(contract_inputs, str),
-        ):
+        )):
             raise ValueError
 
         self.version = version
@@ -388,24 +562,33 @@ class Inputs:
         self.transaction = transaction
         self.op = op
         self.contract_inputs = contract_inputs
+        self._dict = None
 
     @staticmethod
-    def from_json(map: str):
-        json_inputs = json.loads(map)
+    def from_json(map: Union[str, bytes, dict]):
+        return Inputs.from_dict(_as_dict(map))
 
+    @staticmethod
+    def from_dict(json_inputs: dict):
         version = int(json_inputs["version"])
-        account_info = Account.from_json(json_inputs["accountInfo"])
-        transaction = Transaction.from_json(json_inputs["transaction"])
+        account_info = Account.from_dict(json_inputs["accountInfo"])
+        transaction = Transaction.from_dict(json_inputs["transaction"])
         op = json_inputs["op"]
         contract_inputs = json_inputs["contractInputs"]
 
         return Inputs(version, account_info, transaction, op, contract_inputs)
 
     def to_dict(self):
-        return {
-            "version": self.version,
-            "accountInfo": self.account_info.to_dict(),
-            "transaction": self.transaction.to_dict(),
-            "op": self.op,
-            "contractInputs": self.contract_inputs
-        }
+        if self._dict is None:
+            self._dict = {
+                "version": self.version,
+                "accountInfo": self.account_info.to_dict(),
+                "transaction": self.transaction.to_dict(),
+                "op": self.op,
+                "contractInputs": self.contract_inputs
+            }
+        return self._dict
+
+    def to_json_bytes(self) -> bytes:
+        """Serializes the Inputs into UTF-8 encoded JSON bytes"""
+        return dumps_bytes(self.to_dict())
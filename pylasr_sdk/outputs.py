@@ -1,27 +1,125 @@
+import json
+import sys
+from functools import lru_cache
+from operator import methodcaller
 from typing import List, Dict, Tuple, Optional, Union
-from enum import Enum
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+_to_dict = methodcaller("to_dict")
+
+
+def _dumps_bytes(value) -> bytes:
+    """Serializes `value` into compact UTF-8 encoded JSON bytes with `orjson`
+    when it is installed, otherwise with the standard library `json` module
+    """
+    if orjson is not None:
+        return orjson.dumps(value)
+
+    return json.dumps(
+        value, separators=(",", ":"), ensure_ascii=False
+    ).encode("utf-8")
+
+
+def _all_of(items: list, item_type) -> bool:
+    """Checks that every element of `items` is an `item_type`"""
+    return all(isinstance(item, item_type) for item in items)
+
+
+def _is_list_of(items, item_type) -> bool:
+    """Checks that `items` is a list and that every element is an
+    `item_type`"""
+    return isinstance(items, list) and _all_of(items, item_type)
+
+
+def _write_value(buf: bytearray, value):
+    """Writes a plain JSON value (str, dict, list) into `buf` with the same
+    compact, UTF-8 output used by `to_json_bytes`"""
+    buf += _dumps_bytes(value)
+
+
+def _write_hex(buf: bytearray, value: str):
+    """Writes a hex string into `buf` as a JSON string, hex strings never
+    need escaping so this skips the JSON encoder entirely"""
+    buf += b'"'
+    buf += value.encode()
+    buf += b'"'
+
+
+def _write_optional_hex(buf: bytearray, value: Optional[str]):
+    """Writes a hex string into `buf` as a JSON string, or `null` when
+    `value` is None"""
+    if value is None:
+        buf += b"null"
+    else:
+        _write_hex(buf, value)
+
+
+def _write_hex_list(buf: bytearray, items: list):
+    """Writes a list of `Address`es or `U256`s into `buf` as a JSON array of
+    hex strings"""
+    if not items:
+        buf += b"[]"
+        return
+
+    buf += b'["'
+    buf += '","'.join(map(_to_dict, items)).encode()
+    buf += b'"]'
+
+
+def _write_list(buf: bytearray, items: list):
+    """Writes a list of types implementing `write_json` into `buf` as a JSON
+    array"""
+    buf += b"["
+    for i, item in enumerate(items):
+        if i:
+            buf += b","
+        item.write_json(buf)
+    buf += b"]"
 
 
 class Address:
     """
     Represents a 20 byte derived address that matches the Ethereum network
     standard:
-        params: address_bytes - A 20 byte array
+        params: address_bytes - A 20 byte array, any bytes-like object or
+        list of integers is accepted
 
     It is suggested that the developer use the `from_hex` method and use hex
     strings to represent addresses, as they are more human readable for
     debugging purposes
     """
 
-    def __init__(self, address_bytes: List[int]):
+    __slots__ = ("address_bytes", "_hex")
+
+    def __init__(self, address_bytes: Union[bytes, List[int]]):
         if len(address_bytes) != 20:
             raise ValueError("Address must be 20 bytes long")
-        self.address_bytes = bytes(address_bytes)
+        if type(address_bytes) is not bytes:
+            address_bytes = bytes(address_bytes)
+        self.address_bytes = address_bytes
+        self._hex = f"0x{address_bytes.hex()}"
+
+    def __eq__(self, other):
+        if not isinstance(other, Address):
+            return NotImplemented
+        return self.address_bytes == other.address_bytes
+
+    def __hash__(self):
+        return hash(self.address_bytes)
 
     def to_dict(self):
         """Converts an address to hexadecimal string to be included in a JSON
-        blob"""
-        return f"0x{self.address_bytes.hex()}"
+        blob, the string is computed once when the Address is created"""
+        return self._hex
+
+    def write_json(self, buf: bytearray):
+        """Writes the address as a JSON string directly into `buf`"""
+        _write_hex(buf, self._hex)
 
     @staticmethod
     def from_hex(hex_str):
@@ -32,6 +130,14 @@ class Address:
         return Address(bytes.fromhex(hex_str))
 
 
+@lru_cache(maxsize=4096)
+def address_from_hex(hex_str: str) -> Address:
+    """Converts a hexadecimal string into an Address, sharing a single
+    instance per distinct string. Addresses returned from here are shared
+    and must not be mutated"""
+    return Address.from_hex(hex_str)
+
+
 class U256:
     """
     A 256 bit number which can be represented as either a 32 byte array
@@ -41,30 +147,87 @@ class U256:
 
     It is suggested that developers use the `from_hex` method and use
     hex strings to represent U256 and other big numbers.
+
+    U256 is immutable, `value` is read-only so the cached hex and `to_dict`
+    forms always match it. Arithmetic returns a new U256.
     """
 
-    def __init__(self, value: List[int]):
-        self.value = value
+    __slots__ = ("_value", "_hex", "_dict")
+
+    MAX = (1 << 256) - 1
+
+    def __init__(self, value: int):
+        if not isinstance(value, int):
+            raise ValueError("expected `value` to be of type `int`")
+
+        if not 0 <= value <= U256.MAX:
+            raise ValueError("U256 must be in the range 0 to 2**256 - 1")
+
+        self._value = value
+        self._hex = None
+        self._dict = None
+
+    @property
+    def value(self) -> int:
+        return self._value
 
     def to_hex(self):
-        """Converts a U256 into a proper hex format"""
-        return format(self.value, '064x')
+        """Converts a U256 into a proper hex format, the result is cached on
+        the instance so repeated serialization does not re-format the value"""
+        if self._hex is None:
+            self._hex = self._value.to_bytes(32, "big").hex()
+        return self._hex
 
     def to_dict(self):
         """Converts a U256 into a hex format that can be included in a JSON
         blob in the format expect"""
-        return f"0x{self.to_hex()}"
+        if self._dict is None:
+            self._dict = f"0x{self.to_hex()}"
+        return self._dict
+
+    def write_json(self, buf: bytearray):
+        """Writes the U256 as a JSON string directly into `buf`"""
+        _write_hex(buf, self.to_dict())
+
+    def to_bytes(self) -> bytes:
+        """Converts a U256 into its 32 byte big-endian representation"""
+        return self._value.to_bytes(32, "big")
+
+    @staticmethod
+    def from_bytes(value_bytes: bytes):
+        """Converts a 32 byte big-endian array into a U256, the hex form is
+        taken straight from the bytes so serializing it later needs no
+        integer conversion"""
+        if len(value_bytes) != 32:
+            raise ValueError("U256 must be 32 bytes long")
+        u256 = U256(int.from_bytes(value_bytes, "big"))
+        u256._hex = bytes(value_bytes).hex()
+        return u256
+
+    @staticmethod
+    def list_from_bytes(values_bytes: bytes):
+        """Splits a buffer of concatenated 32 byte big-endian values into a
+        list of U256s, the whole buffer is hex encoded in a single call"""
+        if len(values_bytes) % 32:
+            raise ValueError("U256 buffer length must be a multiple of 32")
+        hex_str = bytes(values_bytes).hex()
+        u256s = []
+        for i in range(0, len(hex_str), 64):
+            digits = hex_str[i:i + 64]
+            u256 = U256(int(digits, 16))
+            u256._hex = digits
+            u256s.append(u256)
+        return u256s
 
     @staticmethod
     def from_list(value_list: List[int]):
         """Converts a list of integers (four 64 bit integers) into a U256"""
-        if len(value_list) != 4 or not all(
-            isinstance(x, int) for x in value_list
-        ):
+        if len(value_list) != 4:
             raise ValueError(
                 "U256 must be initialized with a list of 4 integers"
             )
-        return U256(sum(x << (i * 64) for i, x in enumerate(value_list)))
+        a, b, c, d = value_list
+        return U256(a | (b << 64) | (c << 128) | (d << 192))
 
     @staticmethod
     def from_hex(hex_str):
@@ -78,16 +241,25 @@ class U256:
         """Enables deivision on a U256"""
         if not isinstance(other, U256):
             raise TypeError("Division only supported between other U256 types")
-        if other.value == 0:
+        if other._value == 0:
             raise ZeroDivisionError("Division by zero is not possible")
 
-        return U256(self.value // other.value)
+        return U256(self._value // other._value)
 
     # Enables deivision on a U256
     def __floordiv__(self, other):
         return self.__truediv__(other)
 
 
+@lru_cache(maxsize=4096)
+def u256_from_hex(hex_str: str) -> U256:
+    """Converts a hexadecimal string into a U256, sharing a single instance
+    per distinct string. Sharing is safe because U256 is immutable, this is
+    used for values that repeat across payloads such as balances and
+    nonces"""
+    return U256.from_hex(hex_str)
+
+
 class Namespace:
     """
     Represents and account namespace, namespaces are a future feature
@@ -95,12 +267,25 @@ class Namespace:
     namespaces currently as transactions that use them will fail
     """
 
+    __slots__ = ("namespace",)
+
     def __init__(self, namespace: str):
         self.namespace = namespace
 
     def to_dict(self):
         return self.namespace
 
+    def write_json(self, buf: bytearray):
+        """Writes the namespace as a JSON string directly into `buf`"""
+        _write_value(buf, self.namespace)
+
+
+_ADDRESS_OR_NAMESPACE_VALUE_TYPES = {
+    "This": str,
+    "Address": Address,
+    "Namespace": Namespace,
+}
+
 
 class AddressOrNamespace:
     """
@@ -110,32 +295,90 @@ class AddressOrNamespace:
     developers should *ONLY* use Address or `This`, `This` always defaults
     to the address of the contract being called, which is pulled from the
     `Transaction`'s `to` field
+
+    AddressOrNamespace is immutable, its serialized form is computed once
+    when it is created. Use the shared `AddressOrNamespace.THIS` instance
+    rather than constructing a new `This` value for every field.
     """
 
+    __slots__ = ("kind", "value", "_dict")
+
     def __init__(self, kind: str, value: Union[str, Address, Namespace]):
         if not isinstance(kind, str):
-            raise ValueError
+            raise ValueError("expected `kind` to be of type `str`")
 
-        if not isinstance(
-                value,
-                (str, Address, Namespace)
-        ):
-            raise ValueError
+        value_type = _ADDRESS_OR_NAMESPACE_VALUE_TYPES.get(kind)
+        if value_type is None:
+            raise ValueError(
+                "expected `kind` to be one of "
+                f"{list(_ADDRESS_OR_NAMESPACE_VALUE_TYPES)}"
+            )
 
-        self.kind = kind
+        if not isinstance(value, value_type):
+            raise ValueError(
+                f"expected `value` of a `{kind}` to be of type "
+                f"`{value_type.__name__}`"
+            )
+
+        self.kind = sys.intern(kind)
         self.value = value
 
+        if kind == "This":
+            self._dict = "this"
+        elif kind == "Address":
+            self._dict = {"address": value.to_dict()}
+        elif kind == "Namespace":
+            self._dict = {"namespace": value.to_dict()}
+
+    def _key(self):
+        if self.kind == "This":
+            return ("This",)
+        value = self.value
+        if isinstance(value, Namespace):
+            value = value.namespace
+        return (self.kind, value)
+
+    def __eq__(self, other):
+        if not isinstance(other, AddressOrNamespace):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    @staticmethod
+    def from_dict(json_value: Union[str, dict]):
+        """Converts the decoded JSON form produced by `to_dict` back into an
+        AddressOrNamespace"""
+        if isinstance(json_value, str):
+            return AddressOrNamespace.THIS
+
+        kind, value = next(iter(json_value.items()))
+        if kind == "address":
+            return AddressOrNamespace("Address", address_from_hex(value))
+
+        return AddressOrNamespace("Namespace", Namespace(value))
+
     def to_dict(self):
         """Based on the `kind` field, it returns a value that can be
         deserialized in the protocol for the corresponding AddressOrNamespace
         type"""
+        return self._dict
 
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
         if self.kind == "This":
-            return "this"
-        elif self.kind == "Address":
-            return {"address": self.value.to_dict()}
-        else:
-            return {"namespace": self.value.to_dict()}
+            buf += b'"this"'
+            return
+
+        buf += b'{"address":' if self.kind == "Address" else b'{"namespace":'
+        self.value.write_json(buf)
+        buf += b"}"
+
+
+AddressOrNamespace.THIS = AddressOrNamespace("This", "this")
 
 
 class Credit:
@@ -149,16 +392,29 @@ class Credit:
     attempts to alter the Balance of a token, this may change in the future.
     """
 
+    __slots__ = ("value", "_dict")
+
     def __init__(self, value: U256):
-        if not isinstance(value, U256):
-            raise ValueError
+        if __debug__:
+            if not isinstance(value, U256):
+                raise ValueError
 
         self.value = value
+        self._dict = None
 
     def to_dict(self):
         """Converts the Credit instance into a JSON serializable map that the
         protocol will be capable of deserializing into this type"""
-        return {"credit": self.value.to_hex()}
+        if self._dict is None:
+            self._dict = {"credit": self.value.to_hex()}
+        return self._dict
+
+    def write_json(self, buf: bytearray):
+        """Writes this instance as JSON directly into `buf`, producing the
+        same output as serializing `to_dict`"""
+        buf += b'{"credit":'
+        _write_hex(buf, self.value.to_hex())
+        buf += b"}"
 
 
 class Debit:
@@ -173,16 +429,35 @@ class Debit:
     future.
     """
 
+    __slots__ = ("value", "_dict")
+
     def __init__(self, value: U256):
-        if not isinstance(value, U256):
-            raise ValueError
+        if __debug__:
+            if not isinstance(value, U256):
+                raise ValueError
 
         self.value = value
+        self._dict = None
 
     def to_dict(self):
         """Converts the Debit instance into a JSON serializable map that the
         protocol will be capable of deserializing into this type"""
-        return {"debit": self.value.to_hex()}
+        if self._dict is None:
+            self._dict = {"debit": self.value.to_hex()}
+        return self._dict
+
+    def write_json(self, buf: bytearray):
+        """Writes this instance as JSON directly into `buf`, producing the
+        same output as serializing `to_dict`"""
+        buf += b'{"debit":'
+        _write_hex(buf, self.value.to_hex())
+        buf += b"}"
+
+
+_BALANCE_VALUE_TYPES = frozenset((
+    Debit,
+    Credit
+))
 
 
 class BalanceValue:
@@ -195,9 +470,12 @@ class BalanceValue:
     balances
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, value: Union[Debit, Credit]):
-        if not isinstance(value, (Debit, Credit)):
-            raise ValueError
+        if __debug__:
+            if type(value) not in _BALANCE_VALUE_TYPES:
+                raise ValueError
 
         self.value = value
 
@@ -206,6 +484,14 @@ class BalanceValue:
         the protocol will be capable of deserializing into this type"""
         return {"balance": self.value.to_dict()}
 
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b'{"balance":'
+        self.value.write_json(buf)
+        buf += b"}"
+
 
 class TokenMetadataInsert:
     """
@@ -219,12 +505,15 @@ class TokenMetadataInsert:
     in applications.
     """
 
+    __slots__ = ("key", "value")
+
     def __init__(self, key: str, value: str):
-        if not isinstance(key, str):
-            raise ValueError
+        if __debug__:
+            if not isinstance(key, str):
+                raise ValueError
 
-        if not isinstance(value, str):
-            raise ValueError
+            if not isinstance(value, str):
+                raise ValueError
 
         self.key = key
         self.value = value
@@ -234,6 +523,16 @@ class TokenMetadataInsert:
         protocol will be capable of deserializing into this variant type"""
         return {"insert": [self.key, self.value]}
 
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b'{"insert":['
+        _write_value(buf, self.key)
+        buf += b","
+        _write_value(buf, self.value)
+        buf += b"]}"
+
 
 class TokenMetadataExtend:
     """
@@ -249,9 +548,12 @@ class TokenMetadataExtend:
     represent and document them so that they can be used in applications.
     """
 
+    __slots__ = ("map",)
+
     def __init__(self, map: Dict[str, str]):
-        if not isinstance(map, Dict[str, str]):
-            raise ValueError
+        if __debug__:
+            if not isinstance(map, dict):
+                raise ValueError
 
         self.map = map
 
@@ -262,6 +564,14 @@ class TokenMetadataExtend:
         """
         return {"extend": self.map}
 
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b'{"extend":'
+        _write_value(buf, self.map)
+        buf += b"}"
+
 
 class TokenMetadataRemove:
     """
@@ -275,9 +585,12 @@ class TokenMetadataRemove:
     This type simply takes a key.
     """
 
+    __slots__ = ("key",)
+
     def __init__(self, key: str):
-        if not isinstance(key, str):
-            raise ValueError
+        if __debug__:
+            if not isinstance(key, str):
+                raise ValueError
 
         self.key = key
 
@@ -286,8 +599,25 @@ class TokenMetadataRemove:
         by the protocol"""
         return {"remove": self.key}
 
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b'{"remove":'
+        _write_value(buf, self.key)
+        buf += b"}"
+
+
+_TOKEN_METADATA_VALUE_TYPES = frozenset((
+    TokenMetadataInsert,
+    TokenMetadataExtend,
+    TokenMetadataRemove
+))
+
 
 class TokenMetadataValue:
+    __slots__ = ("value",)
+
     def __init__(
         self,
         value: Union[
@@ -296,15 +626,9 @@ class TokenMetadataValue:
             TokenMetadataRemove
         ]
     ):
-        if not isinstance(
-            value,
-            (
-                TokenMetadataInsert,
-                TokenMetadataExtend,
-                TokenMetadataRemove
-            )
-        ):
-            raise ValueError
+        if __debug__:
+            if type(value) not in _TOKEN_METADATA_VALUE_TYPES:
+                raise ValueError
 
         self.value = value
 
@@ -315,6 +639,14 @@ class TokenMetadataValue:
         """
         return {"metadata": self.value.to_dict()}
 
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b'{"metadata":'
+        self.value.write_json(buf)
+        buf += b"}"
+
 
 class TokenIdPush:
     """
@@ -325,18 +657,32 @@ class TokenIdPush:
     This type is effectively a wrapper around a U256
     """
 
+    __slots__ = ("value", "_dict")
+
     def __init__(self, value: U256):
-        if not isinstance(value, U256):
-            raise ValueError
+        if __debug__:
+            if not isinstance(value, U256):
+                raise ValueError
 
         self.value = value
+        self._dict = None
 
     def to_dict(self):
         """
         Converts this enum variant into a JSON serializable map that can be
         deserialized by the protocol into the type it represents
         """
-        return {"push": self.value.to_dict()}
+        if self._dict is None:
+            self._dict = {"push": self.value.to_dict()}
+        return self._dict
+
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b'{"push":'
+        self.value.write_json(buf)
+        buf += b"}"
 
 
 class TokenIdExtend:
@@ -348,16 +694,27 @@ class TokenIdExtend:
     This type is effectively a wrapper around an array of U256's
     """
 
+    __slots__ = ("items",)
+
     def __init__(self, items: List[U256]):
-        if not isinstance(items, List[U256]):
-            raise ValueError
+        if __debug__:
+            if not _is_list_of(items, U256):
+                raise ValueError
 
         self.items = items
 
     def to_dict(self):
         """Converts this enum variant into JSON serializable map that can be
         deserialized by the protocol into the type it represents"""
-        return {"extend": [item.to_dict() for item in self.items]}
+        return {"extend": list(map(U256.to_dict, self.items))}
+
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b'{"extend":'
+        _write_hex_list(buf, self.items)
+        buf += b"}"
 
 
 class TokenIdInsert:
@@ -371,20 +728,36 @@ class TokenIdInsert:
     out of range.
     """
 
+    __slots__ = ("key", "value", "_dict")
+
     def __init__(self, key: int, value: U256):
-        if not isinstance(key, int):
-            raise ValueError
+        if __debug__:
+            if not isinstance(key, int):
+                raise ValueError
 
-        if not isinstance(value, U256):
-            raise ValueError
+            if not isinstance(value, U256):
+                raise ValueError
 
         self.key = key
         self.value = value
+        self._dict = None
 
     def to_dict(self):
         """Converts this enum variant into a JSON serializable map that can the
         protocol can deserialize into the type it represents"""
-        return {"insert": [self.key, self.value.to_dict()]}
+        if self._dict is None:
+            self._dict = {"insert": [self.key, self.value.to_dict()]}
+        return self._dict
+
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b'{"insert":['
+        buf += str(self.key).encode()
+        buf += b","
+        self.value.write_json(buf)
+        buf += b"]}"
 
 
 class TokenIdPop:
@@ -393,16 +766,31 @@ class TokenIdPop:
     to remove the last item in the `Token`'s `token_ids` field. This will
     burn the token ID, effectively, if there is not a replacement of the same
     ID in another account.
+
+    This type carries no state, so every `TokenIdPop()` returns the same
+    shared instance.
     """
 
-    def __init__(self):
-        pass
+    __slots__ = ()
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
 
     def to_dict(self):
         """Returns a string representing this enum variant that can be
         deserialized back into the type in the protocol"""
         return "pop"
 
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b'"pop"'
+
 
 class TokenIdRemove:
     """
@@ -413,15 +801,38 @@ class TokenIdRemove:
     wrong token_id, if the token_ids have changed since being read.
     """
 
+    __slots__ = ("key", "_dict")
+
     def __init__(self, key: U256):
-        if not isinstance(key, U256):
-            raise ValueError
+        if __debug__:
+            if not isinstance(key, U256):
+                raise ValueError
 
         self.key = key
+        self._dict = None
 
     def to_dict(self):
         """Returns a JSON serializable map representing this type"""
-        return {"remove": self.key.to_dict()}
+        if self._dict is None:
+            self._dict = {"remove": self.key.to_dict()}
+        return self._dict
+
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b'{"remove":'
+        self.key.write_json(buf)
+        buf += b"}"
+
+
+_TOKEN_ID_VALUE_TYPES = frozenset((
+    TokenIdPush,
+    TokenIdPop,
+    TokenIdInsert,
+    TokenIdExtend,
+    TokenIdRemove
+))
 
 
 class TokenIdValue:
@@ -444,6 +855,8 @@ class TokenIdValue:
     caution *WARNING*
     """
 
+    __slots__ = ("value",)
+
     def __init__(
         self,
         value: Union[
@@ -454,17 +867,9 @@ class TokenIdValue:
             TokenIdRemove
         ]
     ):
-        if not isinstance(
-            value,
-            (
-                TokenIdPush,
-                TokenIdPop,
-                TokenIdInsert,
-                TokenIdExtend,
-                TokenIdRemove
-            )
-        ):
-            raise ValueError
+        if __debug__:
+            if type(value) not in _TOKEN_ID_VALUE_TYPES:
+                raise ValueError
 
         self.value = value
 
@@ -474,6 +879,14 @@ class TokenIdValue:
         """
         return {"tokenIds": self.value.to_dict()}
 
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b'{"tokenIds":'
+        self.value.write_json(buf)
+        buf += b"}"
+
 
 class AllowanceInsert:
     """
@@ -482,21 +895,37 @@ class AllowanceInsert:
     the `Account`/`Token` pair
     """
 
+    __slots__ = ("key", "value", "_dict")
+
     def __init__(self, key: Address, value: U256):
-        if not isinstance(key, Address):
-            raise ValueError
+        if __debug__:
+            if not isinstance(key, Address):
+                raise ValueError
 
-        if not isinstance(value, U256):
-            raise ValueError
+            if not isinstance(value, U256):
+                raise ValueError
 
         self.key = key
         self.value = value
+        self._dict = None
 
     def to_dict(self):
         """
         Returns a JSON serializable map representing this type
         """
-        return {"insert": [self.key.to_dict(), self.value.to_dict()]}
+        if self._dict is None:
+            self._dict = {"insert": [self.key.to_dict(), self.value.to_dict()]}
+        return self._dict
+
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b'{"insert":['
+        self.key.write_json(buf)
+        buf += b","
+        self.value.write_json(buf)
+        buf += b"]}"
 
 
 class AllowanceExtend:
@@ -506,9 +935,12 @@ class AllowanceExtend:
     from the `Account`/`Token` pair
     """
 
+    __slots__ = ("items",)
+
     def __init__(self, items: List[Tuple[Address, U256]]):
-        if not isinstance(items, List[Tuple[Address, U256]]):
-            raise ValueError
+        if __debug__:
+            if not _is_list_of(items, tuple):
+                raise ValueError
 
         self.items = items
 
@@ -516,14 +948,30 @@ class AllowanceExtend:
         """
         Returns a JSON serializable map representing this type
         """
+        address_to_dict = Address.to_dict
+        u256_to_dict = U256.to_dict
         return {
             "extend": [
-                [item[0].to_dict(),
-                 item[1].to_dict()
-                 ] for item in self.items
+                [address_to_dict(key), u256_to_dict(value)]
+                for key, value in self.items
             ]
         }
 
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b'{"extend":['
+        for i, (key, value) in enumerate(self.items):
+            if i:
+                buf += b","
+            buf += b"["
+            key.write_json(buf)
+            buf += b","
+            value.write_json(buf)
+            buf += b"]"
+        buf += b"]}"
+
 
 class AllowanceRemove:
     """
@@ -531,12 +979,15 @@ class AllowanceRemove:
     that are currently allowed to spend from the `Account`/`Token` pair
     """
 
+    __slots__ = ("key", "items")
+
     def __init__(self, key: Address, items: List[U256]):
-        if not isinstance(key, Address):
-            raise ValueError
+        if __debug__:
+            if not isinstance(key, Address):
+                raise ValueError
 
-        if not isinstance(items, List[U256]):
-            raise ValueError
+            if not _is_list_of(items, U256):
+                raise ValueError
 
         self.key = key
         self.items = items
@@ -548,9 +999,19 @@ class AllowanceRemove:
         return {
             "remove": [
                 self.key.to_dict(),
-                [inner.to_dict() for inner in self.items]
+                list(map(U256.to_dict, self.items))
             ]}
 
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b'{"remove":['
+        self.key.write_json(buf)
+        buf += b","
+        _write_hex_list(buf, self.items)
+        buf += b"]}"
+
 
 class AllowanceRevoke:
     """
@@ -558,18 +1019,40 @@ class AllowanceRevoke:
     granted to other accounts
     """
 
+    __slots__ = ("key", "_dict")
+
     def __init__(self, key: Address):
 
-        if not isinstance(key, Address):
-            raise ValueError
+        if __debug__:
+            if not isinstance(key, Address):
+                raise ValueError
 
         self.key = key
+        self._dict = None
 
     def to_dict(self):
         """
         Returns a JSON serializable map representing this type
         """
-        return {"revoke": self.key.to_dict()}
+        if self._dict is None:
+            self._dict = {"revoke": self.key.to_dict()}
+        return self._dict
+
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b'{"revoke":'
+        self.key.write_json(buf)
+        buf += b"}"
+
+
+_ALLOWANCE_VALUE_TYPES = frozenset((
+    AllowanceInsert,
+    AllowanceExtend,
+    AllowanceRemove,
+    AllowanceRevoke
+))
 
 
 class AllowanceValue:
@@ -578,6 +1061,8 @@ class AllowanceValue:
     `Account`/`Token` pair to have it's allowance field updated.
     """
 
+    __slots__ = ("value",)
+
     def __init__(
         self,
         value: Union[
@@ -588,16 +1073,9 @@ class AllowanceValue:
         ]
     ):
 
-        if not isinstance(
-            value,
-            (
-                AllowanceInsert,
-                AllowanceExtend,
-                AllowanceRemove,
-                AllowanceRevoke
-            )
-        ):
-            raise ValueError
+        if __debug__:
+            if type(value) not in _ALLOWANCE_VALUE_TYPES:
+                raise ValueError
 
         self.value = value
 
@@ -607,6 +1085,14 @@ class AllowanceValue:
         """
         return {"allowance": self.value.to_dict()}
 
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b'{"allowance":'
+        self.value.write_json(buf)
+        buf += b"}"
+
 
 class ApprovalsInsert:
     """
@@ -617,12 +1103,15 @@ class ApprovalsInsert:
     from a given `Account`
     """
 
+    __slots__ = ("key", "value")
+
     def __init__(self, key: Address, value: List[U256]):
-        if not isinstance(key, Address):
-            raise ValueError
+        if __debug__:
+            if not isinstance(key, Address):
+                raise ValueError
 
-        if not isinstance(value, List[U256]):
-            raise ValueError
+            if not _is_list_of(value, U256):
+                raise ValueError
 
         self.key = key
         self.value = value
@@ -632,9 +1121,19 @@ class ApprovalsInsert:
         Returns a JSON serializable map representing this type
         """
         return {"insert": [
-            self.key.to_dict(), [inner.to_dict() for inner in self.value]
+            self.key.to_dict(), list(map(U256.to_dict, self.value))
         ]}
 
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b'{"insert":['
+        self.key.write_json(buf)
+        buf += b","
+        _write_hex_list(buf, self.value)
+        buf += b"]}"
+
 
 class ApprovalsExtend:
     """
@@ -642,9 +1141,12 @@ class ApprovalsExtend:
     to multiple (user or program) accounts at the same time.
     """
 
+    __slots__ = ("items",)
+
     def __init__(self, items: List[Tuple[Address, U256]]):
-        if not isinstance(items, List[Tuple[Address, U256]]):
-            raise ValueError
+        if __debug__:
+            if not _is_list_of(items, tuple):
+                raise ValueError
 
         self.items = items
 
@@ -652,14 +1154,30 @@ class ApprovalsExtend:
         """
         Returns a JSON serializable map representing this type
         """
+        address_to_dict = Address.to_dict
+        u256_to_dict = U256.to_dict
         return {
             "extend": [
-                [item[0].to_dict(),
-                 item[1].to_dict()
-                 ] for item in self.items
+                [address_to_dict(key), u256_to_dict(value)]
+                for key, value in self.items
             ]
         }
 
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b'{"extend":['
+        for i, (key, value) in enumerate(self.items):
+            if i:
+                buf += b","
+            buf += b"["
+            key.write_json(buf)
+            buf += b","
+            value.write_json(buf)
+            buf += b"]"
+        buf += b"]}"
+
 
 class ApprovalsRemove:
     """
@@ -669,12 +1187,15 @@ class ApprovalsRemove:
     from the given `Account`
     """
 
+    __slots__ = ("key", "items")
+
     def __init__(self, key: Address, items: List[U256]):
-        if not isinstance(key, Address):
-            raise ValueError
+        if __debug__:
+            if not isinstance(key, Address):
+                raise ValueError
 
-        if not isinstance(items, List[U256]):
-            raise ValueError
+            if not _is_list_of(items, U256):
+                raise ValueError
 
         self.key = key
         self.items = items
@@ -686,9 +1207,19 @@ class ApprovalsRemove:
         return {
             "remove": [
                 self.key.to_dict(),
-                [inner.to_dict() for inner in self.items]
+                list(map(U256.to_dict, self.items))
             ]}
 
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b'{"remove":['
+        self.key.write_json(buf)
+        buf += b","
+        _write_hex_list(buf, self.items)
+        buf += b"]}"
+
 
 class ApprovalsRevoke:
     """
@@ -696,17 +1227,39 @@ class ApprovalsRevoke:
     where Remove can remove multiple accounts at the same time.
     """
 
+    __slots__ = ("key", "_dict")
+
     def __init__(self, key: Address):
-        if not isinstance(key, Address):
-            raise ValueError("expected `key` to be type `Address`")
+        if __debug__:
+            if not isinstance(key, Address):
+                raise ValueError("expected `key` to be type `Address`")
 
         self.key = key
+        self._dict = None
 
     def to_dict(self):
         """
         Returns a JSON serializable map representing this type
         """
-        return {"revoke": self.key.to_dict()}
+        if self._dict is None:
+            self._dict = {"revoke": self.key.to_dict()}
+        return self._dict
+
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b'{"revoke":'
+        self.key.write_json(buf)
+        buf += b"}"
+
+
+_APPROVALS_VALUE_TYPES = frozenset((
+    ApprovalsInsert,
+    ApprovalsExtend,
+    ApprovalsRemove,
+    ApprovalsRevoke
+))
 
 
 class ApprovalsValue:
@@ -715,6 +1268,8 @@ class ApprovalsValue:
     /`Token` approvals field
     """
 
+    __slots__ = ("value",)
+
     def __init__(
         self,
         value: Union[
@@ -724,22 +1279,15 @@ class ApprovalsValue:
             ApprovalsRevoke,
         ]
     ):
-        if not isinstance(
-                value,
-                (
-                    ApprovalsInsert,
-                    ApprovalsExtend,
-                    ApprovalsRemove,
-                    ApprovalsRevoke
+        if __debug__:
+            if type(value) not in _APPROVALS_VALUE_TYPES:
+                raise ValueError(
+                    """
+                    expected `value` to be one of:
+                    ApprovalsInsert, ApprovalsExtend,
+                    ApprovalsRemove, ApprovalsRevoke
+                    """
                 )
-        ):
-            raise ValueError(
-                """
-                expected `value` to be one of:
-                ApprovalsInsert, ApprovalsExtend,
-                ApprovalsRemove, ApprovalsRevoke
-                """
-            )
 
         self.value = value
 
@@ -749,6 +1297,14 @@ class ApprovalsValue:
         """
         return {"approvals": self.value.to_dict()}
 
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b'{"approvals":'
+        self.value.write_json(buf)
+        buf += b"}"
+
 
 class TokenDataInsert:
     """
@@ -756,12 +1312,15 @@ class TokenDataInsert:
     be inserted in a given `Account`/`Token` `data` field.
     """
 
+    __slots__ = ("key", "value")
+
     def __init__(self, key: str, value: str):
-        if not isinstance(key, str):
-            raise ValueError
+        if __debug__:
+            if not isinstance(key, str):
+                raise ValueError
 
-        if not isinstance(value, str):
-            raise ValueError
+            if not isinstance(value, str):
+                raise ValueError
 
         self.key = key
         self.value = value
@@ -772,6 +1331,16 @@ class TokenDataInsert:
         """
         return {"insert": [self.key, self.value]}
 
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b'{"insert":['
+        _write_value(buf, self.key)
+        buf += b","
+        _write_value(buf, self.value)
+        buf += b"]}"
+
 
 class TokenDataExtend:
     """
@@ -779,9 +1348,12 @@ class TokenDataExtend:
     as a map, inserted into a given `Account`/`Token` `data` field
     """
 
+    __slots__ = ("map",)
+
     def __init__(self, map: Dict[str, str]):
-        if not isinstance(map, Dict[str, str]):
-            raise ValueError
+        if __debug__:
+            if not isinstance(map, dict):
+                raise ValueError
 
         self.map = map
 
@@ -791,6 +1363,14 @@ class TokenDataExtend:
         """
         return {"extend": self.map}
 
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b'{"extend":'
+        _write_value(buf, self.map)
+        buf += b"}"
+
 
 class TokenDataRemove:
     """
@@ -798,9 +1378,12 @@ class TokenDataRemove:
     field
     """
 
+    __slots__ = ("key",)
+
     def __init__(self, key: str):
-        if not isinstance(key, str):
-            raise ValueError
+        if __debug__:
+            if not isinstance(key, str):
+                raise ValueError
 
         self.key = key
 
@@ -810,6 +1393,21 @@ class TokenDataRemove:
         """
         return {"remove": self.key}
 
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b'{"remove":'
+        _write_value(buf, self.key)
+        buf += b"}"
+
+
+_TOKEN_DATA_VALUE_TYPES = frozenset((
+    TokenDataInsert,
+    TokenDataExtend,
+    TokenDataRemove
+))
+
 
 class TokenDataValue:
     """
@@ -817,6 +1415,8 @@ class TokenDataValue:
     pair `data` field
     """
 
+    __slots__ = ("value",)
+
     def __init__(
         self,
         value: Union[
@@ -825,15 +1425,9 @@ class TokenDataValue:
             TokenDataRemove
         ]
     ):
-        if not isinstance(
-            value,
-            (
-                TokenDataInsert,
-                TokenDataExtend,
-                TokenDataRemove
-            )
-        ):
-            raise ValueError
+        if __debug__:
+            if type(value) not in _TOKEN_DATA_VALUE_TYPES:
+                raise ValueError
 
         self.value = value
 
@@ -843,21 +1437,36 @@ class TokenDataValue:
         """
         return {"data": self.value.to_dict()}
 
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b'{"data":'
+        self.value.write_json(buf)
+        buf += b"}"
+
+
+_STATUS_VALUES = frozenset(("free", "locked"))
 
-class StatusValue(Enum):
+
+class StatusValue:
     """
     An enum variant used to update the value of an `Account`/`Token`
     `status` field.
+
+    The shared `StatusValue.FREE` and `StatusValue.LOCKED` instances can be
+    used instead of constructing a new value each time.
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, value: str):
-        valid_kinds = [
-            "free",
-            "locked"
-        ]
+        if value not in _STATUS_VALUES:
+            raise ValueError(
+                f"expected `value` to be one of {sorted(_STATUS_VALUES)}"
+            )
 
-        if value not in valid_kinds:
-            raise ValueError(f"expected `value` to be one of {valid_kinds}")
+        self.value = value
 
     def to_dict(self):
         """
@@ -865,12 +1474,37 @@ class StatusValue(Enum):
         """
         return {"statusValue": self.value}
 
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b'{"statusValue":'
+        _write_value(buf, self.value)
+        buf += b"}"
+
+
+StatusValue.FREE = StatusValue("free")
+StatusValue.LOCKED = StatusValue("locked")
+
+
+_TOKEN_FIELD_VALUE_TYPES = frozenset((
+    StatusValue,
+    TokenDataValue,
+    TokenMetadataValue,
+    ApprovalsValue,
+    AllowanceValue,
+    TokenIdValue,
+    BalanceValue
+))
+
 
 class TokenFieldValue:
     """
     A type that is used to update a given field in an `Account`/`Token`
     """
 
+    __slots__ = ("kind", "value")
+
     def __init__(
         self,
         kind: str,
@@ -885,24 +1519,14 @@ class TokenFieldValue:
         ]
     ):
 
-        if not isinstance(kind, str):
-            raise ValueError
+        if __debug__:
+            if not isinstance(kind, str):
+                raise ValueError
 
-        if not isinstance(
-            value,
-            (
-                StatusValue,
-                TokenDataValue,
-                TokenMetadataValue,
-                ApprovalsValue,
-                AllowanceValue,
-                TokenIdValue,
-                BalanceValue
-            )
-        ):
-            raise ValueError
+            if type(value) not in _TOKEN_FIELD_VALUE_TYPES:
+                raise ValueError
 
-        self.kind = kind
+        self.kind = sys.intern(kind)
         self.value = value
 
     def to_dict(self):
@@ -911,15 +1535,28 @@ class TokenFieldValue:
         """
         return {self.kind: self.value.to_dict()}
 
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b"{"
+        _write_value(buf, self.kind)
+        buf += b":"
+        self.value.write_json(buf)
+        buf += b"}"
+
 
 class TokenField:
     """
     A Type representing a field in a `Token`
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, value: str):
-        if not isinstance(value, str):
-            raise ValueError
+        if __debug__:
+            if not isinstance(value, str):
+                raise ValueError
 
         self.value = value
 
@@ -929,6 +1566,12 @@ class TokenField:
         """
         return self.value
 
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        _write_value(buf, self.value)
+
 
 class TokenUpdateField:
     """
@@ -936,13 +1579,18 @@ class TokenUpdateField:
     be updated
     """
 
+    __slots__ = ("field", "value")
+
     def __init__(self, field: TokenField, value: TokenFieldValue):
 
-        if not isinstance(field, TokenField):
-            raise ValueError("expected `field` to be type `TokenField`")
+        if __debug__:
+            if not isinstance(field, TokenField):
+                raise ValueError("expected `field` to be type `TokenField`")
 
-        if not isinstance(value, TokenFieldValue):
-            raise ValueError("expected `value` to be type `TokenFieldValue")
+            if not isinstance(value, TokenFieldValue):
+                raise ValueError(
+                    "expected `value` to be type `TokenFieldValue`"
+                )
 
         self.field = field
         self.value = value
@@ -956,6 +1604,16 @@ class TokenUpdateField:
             "value": self.value.to_dict(),
         }
 
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b'{"field":'
+        self.field.write_json(buf)
+        buf += b',"value":'
+        self.value.write_json(buf)
+        buf += b"}"
+
 
 class TokenUpdate:
     """
@@ -963,20 +1621,23 @@ class TokenUpdate:
     pair
     """
 
+    __slots__ = ("account", "token", "updates")
+
     def __init__(
         self,
         account: AddressOrNamespace,
         token: AddressOrNamespace,
         updates: List[TokenUpdateField]
     ):
-        if not isinstance(account, AddressOrNamespace):
-            raise ValueError("expected type `AddressOrNamespace`")
+        if __debug__:
+            if not isinstance(account, AddressOrNamespace):
+                raise ValueError("expected type `AddressOrNamespace`")
 
-        if not isinstance(token, AddressOrNamespace):
-            raise ValueError("expected type `AddressOrNamespace`")
+            if not isinstance(token, AddressOrNamespace):
+                raise ValueError("expected type `AddressOrNamespace`")
 
-        if not isinstance(updates, List[TokenUpdateField]):
-            raise ValueError("expected type `AddressOrNamespace`")
+            if not _is_list_of(updates, TokenUpdateField):
+                raise ValueError("expected type `AddressOrNamespace`")
 
         self.account = account
         self.token = token
@@ -987,11 +1648,23 @@ class TokenUpdate:
         Returns a JSON serializable map representing this type
         """
         return {
-            "account": self.account,
-            "token": self.token,
-            "updates": [update.to_dict() for update in self.updates]
+            "account": self.account.to_dict(),
+            "token": self.token.to_dict(),
+            "updates": list(map(TokenUpdateField.to_dict, self.updates))
         }
 
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b'{"account":'
+        self.account.write_json(buf)
+        buf += b',"token":'
+        self.token.write_json(buf)
+        buf += b',"updates":'
+        _write_list(buf, self.updates)
+        buf += b"}"
+
 
 class LinkedProgramsInsert:
     """
@@ -999,17 +1672,31 @@ class LinkedProgramsInsert:
     into a Program Account.
     """
 
+    __slots__ = ("key", "_dict")
+
     def __init__(self, key: Address):
-        if not isinstance(key, Address):
-            raise ValueError("expected type `Address`")
+        if __debug__:
+            if not isinstance(key, Address):
+                raise ValueError("expected type `Address`")
 
         self.key = key
+        self._dict = None
 
     def to_dict(self):
         """
         Returns a JSON serializable map representing this type
         """
-        return {"insert": self.key.to_dict()}
+        if self._dict is None:
+            self._dict = {"insert": self.key.to_dict()}
+        return self._dict
+
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b'{"insert":'
+        self.key.write_json(buf)
+        buf += b"}"
 
 
 class LinkedProgramsExtend:
@@ -1018,10 +1705,13 @@ class LinkedProgramsExtend:
     LinkedPrograms into a Program Account
     """
 
+    __slots__ = ("items",)
+
     def __init__(self, items: List[Address]):
 
-        if not isinstance(items, List[Address]):
-            raise ValueError("expected type `List[Address]`")
+        if __debug__:
+            if not _is_list_of(items, Address):
+                raise ValueError("expected type `List[Address]`")
 
         self.items = items
 
@@ -1029,7 +1719,15 @@ class LinkedProgramsExtend:
         """
         Returns a JSON serializable map representing this type
         """
-        return {"extend": [item.to_dict() for item in self.items]}
+        return {"extend": list(map(Address.to_dict, self.items))}
+
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b'{"extend":'
+        _write_hex_list(buf, self.items)
+        buf += b"}"
 
 
 class LinkedProgramsRemove:
@@ -1038,17 +1736,44 @@ class LinkedProgramsRemove:
     a Program Account
     """
 
+    __slots__ = ("key", "_dict")
+
     def __init__(self, key: Address):
-        if not isinstance(key, Address):
-            raise ValueError("expected type `Address`")
+        if __debug__:
+            if not isinstance(key, Address):
+                raise ValueError("expected type `Address`")
 
         self.key = key
+        self._dict = None
 
     def to_dict(self):
         """
         Returns a JSON serializable map representing this type
         """
-        return {"remove": self.key.to_dict()}
+        if self._dict is None:
+            self._dict = {"remove": self.key.to_dict()}
+        return self._dict
+
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b'{"remove":'
+        self.key.write_json(buf)
+        buf += b"}"
+
+
+_LINKED_PROGRAMS_VALUE_TYPES = frozenset((
+    LinkedProgramsInsert,
+    LinkedProgramsExtend,
+    LinkedProgramsRemove
+))
+
+_LINKED_PROGRAMS_KINDS = frozenset((
+    "linkedprogramsremove",
+    "linkedprogramsextend",
+    "linkedprogramsinsert"
+))
 
 
 class LinkedProgramsValue:
@@ -1057,6 +1782,8 @@ class LinkedProgramsValue:
     of a Program Account
     """
 
+    __slots__ = ("kind", "value")
+
     def __init__(
         self,
         kind: str,
@@ -1069,30 +1796,21 @@ class LinkedProgramsValue:
         if not isinstance(kind, str):
             raise ValueError("expected `kind` to be of type `str`")
 
-        valid_kinds = [
-            "linkedprogramsremove",
-            "linkedprogramsextend",
-            "linkedprogramsinsert"
-        ]
-
-        if kind.lower() not in valid_kinds:
-            raise ValueError(f"expected `kind` to be one of {valid_kinds}")
-
-        if not isinstance(
-                value,
-                (
-                    LinkedProgramsInsert,
-                    LinkedProgramsExtend,
-                    LinkedProgramsRemove
-                )
-        ):
+        if kind.lower() not in _LINKED_PROGRAMS_KINDS:
             raise ValueError(
-                """expected `value` to be one of
-                LinkedProgramsInsert, LinkedProgramsExtend or
-                LinkedProgramsRemove"""
+                "expected `kind` to be one of "
+                f"{sorted(_LINKED_PROGRAMS_KINDS)}"
             )
 
-        self.kind = kind
+        if __debug__:
+            if type(value) not in _LINKED_PROGRAMS_VALUE_TYPES:
+                raise ValueError(
+                    """expected `value` to be one of
+                    LinkedProgramsInsert, LinkedProgramsExtend or
+                    LinkedProgramsRemove"""
+                )
+
+        self.kind = sys.intern(kind)
         self.value = value
 
     def to_dict(self):
@@ -1101,6 +1819,14 @@ class LinkedProgramsValue:
         """
         return {"linkedProgramValue": self.value.to_dict()}
 
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b'{"linkedProgramValue":'
+        self.value.write_json(buf)
+        buf += b"}"
+
 
 class ProgramMetadataInsert:
     """
@@ -1108,6 +1834,8 @@ class ProgramMetadataInsert:
     pair into a Program Account metadata field
     """
 
+    __slots__ = ("key", "value")
+
     def __init__(self, key: str, value: str):
         if not isinstance(key, str):
             raise ValueError
@@ -1124,6 +1852,16 @@ class ProgramMetadataInsert:
         """
         return {"insert": [self.key, self.value]}
 
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b'{"insert":['
+        _write_value(buf, self.key)
+        buf += b","
+        _write_value(buf, self.value)
+        buf += b"]}"
+
 
 class ProgramMetadataExtend:
     """
@@ -1131,8 +1869,10 @@ class ProgramMetadataExtend:
     pairs into a Program Account metadata field
     """
 
+    __slots__ = ("map",)
+
     def __init__(self, map: Dict[str, str]):
-        if not isinstance(map, Dict[str, str]):
+        if not isinstance(map, dict):
             raise ValueError
 
         self.map = map
@@ -1143,6 +1883,14 @@ class ProgramMetadataExtend:
         """
         return {"extend": self.map}
 
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b'{"extend":'
+        _write_value(buf, self.map)
+        buf += b"}"
+
 
 class ProgramMetadataRemove:
     """
@@ -1150,6 +1898,8 @@ class ProgramMetadataRemove:
     pair from a Program Account
     """
 
+    __slots__ = ("key",)
+
     def __init__(self, key: str):
         if not isinstance(key, str):
             raise ValueError
@@ -1162,6 +1912,21 @@ class ProgramMetadataRemove:
         """
         return {"remove": self.key}
 
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b'{"remove":'
+        _write_value(buf, self.key)
+        buf += b"}"
+
+
+_PROGRAM_METADATA_KINDS = frozenset((
+    "programmetadatainsert",
+    "programmetadataextend",
+    "programmetadataremove"
+))
+
 
 class ProgramMetadataValue:
     """
@@ -1169,6 +1934,8 @@ class ProgramMetadataValue:
     in a Program Account
     """
 
+    __slots__ = ("kind", "value")
+
     def __init__(
         self,
         kind: str,
@@ -1181,14 +1948,10 @@ class ProgramMetadataValue:
         if not isinstance(kind, str):
             raise ValueError("expected `kind` to be `str`")
 
-        valid_kinds = [
-            "programmetadatainsert",
-            "programmetadataextend",
-            "programmetadataremove"
-        ]
-
-        if kind.lower() not in valid_kinds:
-            raise ValueError(f"expected kind to be one of {valid_kinds}")
+        if kind.lower() not in _PROGRAM_METADATA_KINDS:
+            raise ValueError(
+                f"expected kind to be one of {sorted(_PROGRAM_METADATA_KINDS)}"
+            )
 
         if not isinstance(
             value,
@@ -1207,15 +1970,23 @@ class ProgramMetadataValue:
                 """
             )
 
-        self.kind = kind
+        self.kind = sys.intern(kind)
         self.value = value
 
-    def to_json(self):
+    def to_dict(self):
         """
         Returns a JSON serializable map representing this type
         """
         return {"metadata": self.value.to_dict()}
 
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b'{"metadata":'
+        self.value.write_json(buf)
+        buf += b"}"
+
 
 class ProgramDataInsert:
     """
@@ -1223,6 +1994,8 @@ class ProgramDataInsert:
     into the program_data field
     """
 
+    __slots__ = ("key", "value")
+
     def __init__(self, key: str, value: str):
         if not isinstance(key, str):
             raise ValueError
@@ -1239,6 +2012,16 @@ class ProgramDataInsert:
         """
         return {"insert": [self.key, self.value]}
 
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b'{"insert":['
+        _write_value(buf, self.key)
+        buf += b","
+        _write_value(buf, self.value)
+        buf += b"]}"
+
 
 class ProgramDataExtend:
     """
@@ -1246,8 +2029,10 @@ class ProgramDataExtend:
     into the program_data field
     """
 
+    __slots__ = ("map",)
+
     def __init__(self, map: Dict[str, str]):
-        if not isinstance(map, Dict[str, str]):
+        if not isinstance(map, dict):
             raise ValueError
 
         self.map = map
@@ -1258,6 +2043,14 @@ class ProgramDataExtend:
         """
         return {"extend": self.map}
 
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b'{"extend":'
+        _write_value(buf, self.map)
+        buf += b"}"
+
 
 class ProgramDataRemove:
     """
@@ -1265,6 +2058,8 @@ class ProgramDataRemove:
     program_data field
     """
 
+    __slots__ = ("key",)
+
     def __init__(self, key: str):
         if not isinstance(key, str):
             raise ValueError
@@ -1277,12 +2072,22 @@ class ProgramDataRemove:
         """
         return {"remove": self.key}
 
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b'{"remove":'
+        _write_value(buf, self.key)
+        buf += b"}"
+
 
 class ProgramDataValue:
     """
     A type used to represent a value being updated in a program data field
     """
 
+    __slots__ = ("value",)
+
     def __init__(
         self,
         value: Union[
@@ -1309,6 +2114,14 @@ class ProgramDataValue:
         """
         return {"data": self.value.to_dict()}
 
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b'{"data":'
+        self.value.write_json(buf)
+        buf += b"}"
+
 
 class ProgramFieldValue:
     """
@@ -1316,6 +2129,8 @@ class ProgramFieldValue:
     data field
     """
 
+    __slots__ = ("kind", "value")
+
     def __init__(
         self,
         kind: str,
@@ -1338,7 +2153,7 @@ class ProgramFieldValue:
         ):
             raise ValueError
 
-        self.kind = kind
+        self.kind = sys.intern(kind)
         self.value = value
 
     def to_dict(self):
@@ -1347,6 +2162,16 @@ class ProgramFieldValue:
         """
         return {self.kind: self.value.to_dict()}
 
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b"{"
+        _write_value(buf, self.kind)
+        buf += b":"
+        self.value.write_json(buf)
+        buf += b"}"
+
 
 class ProgramField:
     """
@@ -1354,6 +2179,8 @@ class ProgramField:
     program account
     """
 
+    __slots__ = ("kind",)
+
     def __init__(self, kind: str):
         if not isinstance(kind, str):
             raise ValueError
@@ -1366,12 +2193,20 @@ class ProgramField:
         """
         return self.kind
 
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        _write_value(buf, self.kind)
+
 
 class ProgramUpdateField:
     """
     A type representing an program field to be updated, with a given value
     """
 
+    __slots__ = ("field", "value")
+
     def __init__(self, field: ProgramField, value: ProgramFieldValue):
         if not isinstance(field, ProgramField):
             raise ValueError
@@ -1391,12 +2226,24 @@ class ProgramUpdateField:
             "value": self.value.to_dict()
         }
 
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b'{"field":'
+        self.field.write_json(buf)
+        buf += b',"value":'
+        self.value.write_json(buf)
+        buf += b"}"
+
 
 class ProgramUpdate:
     """
     A type that is used to pass multiple updates to a given program account
     """
 
+    __slots__ = ("account", "updates")
+
     def __init__(
         self,
         account: AddressOrNamespace,
@@ -1405,7 +2252,7 @@ class ProgramUpdate:
         if not isinstance(account, AddressOrNamespace):
             raise ValueError
 
-        if not isinstance(updates, List[ProgramUpdateField]):
+        if not _is_list_of(updates, ProgramUpdateField):
             raise ValueError
 
         self.account = account
@@ -1416,10 +2263,20 @@ class ProgramUpdate:
         Returns a JSON serializable map representing this type
         """
         return {
-            "account": self.account,
-            "updates": [update.to_dict() for update in self.updates]
+            "account": self.account.to_dict(),
+            "updates": list(map(ProgramUpdateField.to_dict, self.updates))
         }
 
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b'{"account":'
+        self.account.write_json(buf)
+        buf += b',"updates":'
+        _write_list(buf, self.updates)
+        buf += b"}"
+
 
 class TokenOrProgramUpdate:
     """
@@ -1427,6 +2284,8 @@ class TokenOrProgramUpdate:
     update.
     """
 
+    __slots__ = ("kind", "value")
+
     def __init__(self, kind: str, value: Union[TokenUpdate, ProgramUpdate]):
         if not isinstance(kind, str):
             raise ValueError
@@ -1434,7 +2293,7 @@ class TokenOrProgramUpdate:
         if not isinstance(value, (TokenUpdate, ProgramUpdate)):
             raise ValueError
 
-        self.kind = kind
+        self.kind = sys.intern(kind)
         self.value = value
 
     def to_dict(self):
@@ -1443,6 +2302,16 @@ class TokenOrProgramUpdate:
         """
         return {self.kind: self.value.to_dict()}
 
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b"{"
+        _write_value(buf, self.kind)
+        buf += b":"
+        self.value.write_json(buf)
+        buf += b"}"
+
 
 class TokenDistribution:
     """
@@ -1450,6 +2319,15 @@ class TokenDistribution:
     token and token data at the creation.
     """
 
+    __slots__ = (
+        "program_id",
+        "to",
+        "_amount",
+        "token_ids",
+        "update_fields",
+        "_amount_dict",
+    )
+
     def __init__(
         self,
         program_id: AddressOrNamespace,
@@ -1459,13 +2337,13 @@ class TokenDistribution:
         update_fields: List[TokenUpdateField]
     ):
 
-        if not all(
+        if not all((
             isinstance(program_id, AddressOrNamespace),
             isinstance(to, AddressOrNamespace),
-            isinstance(amount, (None, U256)),
-            isinstance(token_ids, List[U256]),
-            isinstance(update_fields, List[TokenUpdateField])
-        ):
+            (amount is None or isinstance(amount, U256)),
+            _is_list_of(token_ids, U256),
+            _is_list_of(update_fields, TokenUpdateField)
+        )):
             raise ValueError
 
         self.program_id = program_id
@@ -1474,6 +2352,15 @@ class TokenDistribution:
         self.token_ids = token_ids
         self.update_fields = update_fields
 
+    @property
+    def amount(self) -> Optional[U256]:
+        return self._amount
+
+    @amount.setter
+    def amount(self, amount: Optional[U256]):
+        self._amount = amount
+        self._amount_dict = None if amount is None else amount.to_dict()
+
     def to_dict(self):
         """
         Returns a JSON serializable map representing this type
@@ -1481,11 +2368,29 @@ class TokenDistribution:
         return {
             "programId": self.program_id.to_dict(),
             "to": self.to.to_dict(),
-            "amount": "null" if self.amount is None else self.amount.to_dict(),
-            "tokenIds": [item.to_dict() for item in self.token_ids],
-            "updateFields": [item.to_dict() for item in self.update_fields]
+            "amount": self._amount_dict,
+            "tokenIds": list(map(U256.to_dict, self.token_ids)),
+            "updateFields": list(
+                map(TokenUpdateField.to_dict, self.update_fields)
+            )
         }
 
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b'{"programId":'
+        self.program_id.write_json(buf)
+        buf += b',"to":'
+        self.to.write_json(buf)
+        buf += b',"amount":'
+        _write_optional_hex(buf, self._amount_dict)
+        buf += b',"tokenIds":'
+        _write_hex_list(buf, self.token_ids)
+        buf += b',"updateFields":'
+        _write_list(buf, self.update_fields)
+        buf += b"}"
+
 
 class CreateInstruction:
     """
@@ -1513,6 +2418,15 @@ class CreateInstruction:
         return of this type
     """
 
+    __slots__ = (
+        "program_namespace",
+        "program_id",
+        "program_owner",
+        "total_supply",
+        "initialized_supply",
+        "distribution",
+    )
+
     def __init__(
         self,
         program_namespace: AddressOrNamespace,
@@ -1523,14 +2437,14 @@ class CreateInstruction:
         distribution: List[TokenDistribution]
     ):
 
-        if not all(
+        if not all((
             isinstance(program_namespace, AddressOrNamespace),
             isinstance(program_id, AddressOrNamespace),
             isinstance(program_owner, Address),
             isinstance(total_supply, U256),
             isinstance(initialized_supply, U256),
-            isinstance(distribution, List[TokenDistribution])
-        ):
+            _is_list_of(distribution, TokenDistribution)
+        )):
             raise ValueError
 
         self.program_namespace = program_namespace
@@ -1550,11 +2464,29 @@ class CreateInstruction:
             "programOwner": self.program_owner.to_dict(),
             "totalSupply": self.total_supply.to_dict(),
             "initializedSupply": self.initialized_supply.to_dict(),
-            "distribution": [
-                dist.to_dict() for dist in self.distribution
-            ]
+            "distribution": list(
+                map(TokenDistribution.to_dict, self.distribution)
+            )
         }
 
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b'{"programNamespace":'
+        self.program_namespace.write_json(buf)
+        buf += b',"programId":'
+        self.program_id.write_json(buf)
+        buf += b',"programOwner":'
+        self.program_owner.write_json(buf)
+        buf += b',"totalSupply":'
+        self.total_supply.write_json(buf)
+        buf += b',"initializedSupply":'
+        self.initialized_supply.write_json(buf)
+        buf += b',"distribution":'
+        _write_list(buf, self.distribution)
+        buf += b"}"
+
 
 class UpdateInstruction:
     """
@@ -1568,9 +2500,11 @@ class UpdateInstruction:
     fails
     """
 
+    __slots__ = ("updates",)
+
     def __init__(self, updates: List[TokenOrProgramUpdate]):
 
-        if not isinstance(updates, List[TokenOrProgramUpdate]):
+        if not _is_list_of(updates, TokenOrProgramUpdate):
             raise ValueError
 
         self.updates = updates
@@ -1580,9 +2514,17 @@ class UpdateInstruction:
         Returns a JSON serializable map representing this type
         """
         return {
-            "updates": [update.to_dict() for update in self.updates]
+            "updates": list(map(TokenOrProgramUpdate.to_dict, self.updates))
         }
 
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b'{"updates":'
+        _write_list(buf, self.updates)
+        buf += b"}"
+
 
 class TransferInstruction:
     """
@@ -1591,6 +2533,15 @@ class TransferInstruction:
     `Account`/`Token` pair to another `Account`.
     """
 
+    __slots__ = (
+        "token",
+        "transfer_from",
+        "transfer_to",
+        "_amount",
+        "ids",
+        "_amount_dict",
+    )
+
     def __init__(
         self,
         token: Address,
@@ -1600,13 +2551,13 @@ class TransferInstruction:
         ids: List[U256]
     ):
 
-        if not all(
+        if not all((
             isinstance(token, Address),
             isinstance(transfer_from, AddressOrNamespace),
             isinstance(transfer_to, AddressOrNamespace),
-            isinstance(amount, (None, U256)),
-            isinstance(ids, List[U256])
-        ):
+            (amount is None or isinstance(amount, U256)),
+            _is_list_of(ids, U256)
+        )):
             raise ValueError
 
         self.token = token
@@ -1615,6 +2566,15 @@ class TransferInstruction:
         self.amount = amount
         self.ids = ids
 
+    @property
+    def amount(self) -> Optional[U256]:
+        return self._amount
+
+    @amount.setter
+    def amount(self, amount: Optional[U256]):
+        self._amount = amount
+        self._amount_dict = None if amount is None else amount.to_dict()
+
     def to_dict(self):
         """
         Returns a JSON serializable map representing this type
@@ -1623,10 +2583,26 @@ class TransferInstruction:
             "token": self.token.to_dict(),
             "from": self.transfer_from.to_dict(),
             "to": self.transfer_to.to_dict(),
-            "amount": "null" if self.amount is None else self.amount.to_dict(),
-            "ids": [item.to_dict() for item in self.ids]
+            "amount": self._amount_dict,
+            "ids": list(map(U256.to_dict, self.ids))
         }
 
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b'{"token":'
+        self.token.write_json(buf)
+        buf += b',"from":'
+        self.transfer_from.write_json(buf)
+        buf += b',"to":'
+        self.transfer_to.write_json(buf)
+        buf += b',"amount":'
+        _write_optional_hex(buf, self._amount_dict)
+        buf += b',"ids":'
+        _write_hex_list(buf, self.ids)
+        buf += b"}"
+
 
 class BurnInstruction:
     """
@@ -1636,6 +2612,16 @@ class BurnInstruction:
     explicit approval for the `burn_from` `Account` for the given `token`.
     """
 
+    __slots__ = (
+        "caller",
+        "program_id",
+        "token",
+        "burn_from",
+        "_amount",
+        "token_ids",
+        "_amount_dict",
+    )
+
     def __init__(
         self,
         caller: Address,
@@ -1646,14 +2632,14 @@ class BurnInstruction:
         token_ids: List[U256],
     ):
 
-        if not all(
+        if not all((
             isinstance(caller, Address),
             isinstance(program_id, AddressOrNamespace),
             isinstance(token, Address),
             isinstance(burn_from, AddressOrNamespace),
-            isinstance(amount, (None, U256)),
-            isinstance(token_ids, List[U256])
-        ):
+            (amount is None or isinstance(amount, U256)),
+            _is_list_of(token_ids, U256)
+        )):
             raise ValueError
 
         self.caller = caller
@@ -1663,6 +2649,15 @@ class BurnInstruction:
         self.amount = amount
         self.token_ids = token_ids
 
+    @property
+    def amount(self) -> Optional[U256]:
+        return self._amount
+
+    @amount.setter
+    def amount(self, amount: Optional[U256]):
+        self._amount = amount
+        self._amount_dict = None if amount is None else amount.to_dict()
+
     def to_dict(self):
         """
         Returns a JSON serializable map representing this type
@@ -1672,12 +2667,44 @@ class BurnInstruction:
             "programId": self.program_id.to_dict(),
             "token": self.token.to_dict(),
             "from": self.burn_from.to_dict(),
-            "amount": "null" if self.amount is None else self.amount.to_dict(),
-            "ids": [item.to_dict() for item in self.token_ids]
+            "amount": self._amount_dict,
+            "ids": list(map(U256.to_dict, self.token_ids))
         }
 
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b'{"caller":'
+        self.caller.write_json(buf)
+        buf += b',"programId":'
+        self.program_id.write_json(buf)
+        buf += b',"token":'
+        self.token.write_json(buf)
+        buf += b',"from":'
+        self.burn_from.write_json(buf)
+        buf += b',"amount":'
+        _write_optional_hex(buf, self._amount_dict)
+        buf += b',"ids":'
+        _write_hex_list(buf, self.token_ids)
+        buf += b"}"
+
 
 class LogInstruction:
+    """
+    A placeholder instruction that currently carries no data. Like
+    `TokenIdPop` it is stateless, so every `LogInstruction()` returns the
+    same shared instance.
+    """
+
+    __slots__ = ()
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
 
     def to_dict(self):
         """
@@ -1685,6 +2712,22 @@ class LogInstruction:
         """
         return {}
 
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b"{}"
+
+
+# maps each instruction variant to its unbound `to_dict`, letting `Outputs`
+# serialize an `Instruction` without an extra method call per item
+_INSTRUCTION_TO_DICT = {
+    CreateInstruction: CreateInstruction.to_dict,
+    UpdateInstruction: UpdateInstruction.to_dict,
+    TransferInstruction: TransferInstruction.to_dict,
+    BurnInstruction: BurnInstruction.to_dict,
+}
+
 
 class Instruction:
     """
@@ -1692,6 +2735,8 @@ class Instruction:
     CreateInstruction, UpdateInstruction, TransferInstruction, BurnInstruction
     """
 
+    __slots__ = ("kind", "value")
+
     def __init__(
         self,
         kind: str,
@@ -1702,7 +2747,7 @@ class Instruction:
             TransferInstruction
         ]
     ):
-        if not all(
+        if not all((
             isinstance(kind, str),
             isinstance(
                 value,
@@ -1713,48 +2758,96 @@ class Instruction:
                     TransferInstruction
                 )
             )
-        ):
+        )):
             raise ValueError
 
-        self.kind = kind
+        self.kind = sys.intern(kind)
         self.value = value
 
     def to_dict(self):
         """
         Returns a JSON serializable map representing this type
         """
+        value = self.value
         return {
-            self.kind: self.value.to_dict()
+            self.kind: _INSTRUCTION_TO_DICT[type(value)](value)
         }
 
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b"{"
+        _write_value(buf, self.kind)
+        buf += b":"
+        self.value.write_json(buf)
+        buf += b"}"
+
 
 class Outputs:
     """
     This type is the wrapper around the entirity of what will be returned
     from a given program back to the LASR protocol for validation & processing.
+
+    The result of `to_dict` is built once and cached, fields should not be
+    modified after the first call to `to_dict`.
     """
 
+    __slots__ = ("inputs", "instructions", "_dict")
+
     def __init__(self, inputs: str, instructions: List[Instruction]):
 
-        if not all(
-            isinstance(input, str),
-            isinstance(instructions, List[Instruction])
-        ):
+        if not all((
+            isinstance(inputs, str),
+            _is_list_of(instructions, Instruction)
+        )):
             raise ValueError
 
         self.inputs = inputs
         self.instructions = instructions
+        self._dict = None
 
     def to_dict(self):
         """
         Returns a JSON serializable map representing this type
         """
-        return {
-            "inputs": self.inputs,
-            "instructions": [
-                instruction.to_dict() for instruction in self.instructions
-            ]
-        }
+        if self._dict is None:
+            dispatch = _INSTRUCTION_TO_DICT
+            self._dict = {
+                "inputs": self.inputs,
+                "instructions": [
+                    {i.kind: dispatch[type(i.value)](i.value)}
+                    for i in self.instructions
+                ]
+            }
+        return self._dict
+
+    def write_json(self, buf: bytearray):
+        """
+        Writes this type as JSON directly into `buf`
+        """
+        buf += b'{"inputs":'
+        _write_value(buf, self.inputs)
+        buf += b',"instructions":'
+        _write_list(buf, self.instructions)
+        buf += b"}"
+
+    def to_json(self) -> str:
+        """
+        Serializes the Outputs into a JSON string in a single pass over a
+        shared buffer, without building the intermediate `to_dict` tree
+        """
+        buf = bytearray()
+        self.write_json(buf)
+        return buf.decode()
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Serializes the Outputs into UTF-8 encoded JSON bytes, encoding the
+        `to_dict` tree with `orjson` when it is installed and falling back
+        to the standard library `json` module otherwise
+        """
+        return _dumps_bytes(self.to_dict())
 
 
 class TokenUpdateBuilder:
@@ -1765,6 +2858,8 @@ class TokenUpdateBuilder:
     which contain such a type.
     """
 
+    __slots__ = ("account", "token", "updates")
+
     def __init__(
         self,
         account: Optional[AddressOrNamespace] = None,
@@ -1774,13 +2869,16 @@ class TokenUpdateBuilder:
         self.token = None
         self.updates = []
 
+        if account is not None:
+            self.add_update_account_address(account)
+
+        if token is not None:
+            self.add_token_address(token)
+
     def add_update_account_address(self, account: AddressOrNamespace):
         """
         Adds a new account address to the TokenUpdate
         """
-        if not isinstance(account, AddressOrNamespace):
-            raise ValueError
-
         self.account = account
         return self
 
@@ -1788,8 +2886,6 @@ class TokenUpdateBuilder:
         """
         Adds a new `token` address to the TokenUpdate
         """
-        if not isinstance(token_address, AddressOrNamespace):
-            raise ValueError
         self.token = token_address
         return self
 
@@ -1797,9 +2893,6 @@ class TokenUpdateBuilder:
         """
         Appends a single update_field
         """
-        if not isinstance(update_field, TokenUpdateField):
-            raise ValueError
-
         self.updates.append(update_field)
         return self
 
@@ -1807,28 +2900,29 @@ class TokenUpdateBuilder:
         """
         Appends multiple update_fields to the TokenUpdate
         """
-        if not isinstance(update_fields, List[TokenUpdateField]):
-            raise ValueError
-
-        self.updates = self.updates + update_fields
+        self.updates.extend(update_fields)
+        return self
 
     def build(self) -> TokenUpdate:
         """
         Takes this builder class and builds/converts it to a TokenUpdate
         """
-        if self.account is None:
+        if not isinstance(self.account, AddressOrNamespace):
             raise ValueError
 
-        if self.token is None:
+        if not isinstance(self.token, AddressOrNamespace):
             raise ValueError
 
         if len(self.updates) == 0:
             raise ValueError
 
+        if not _all_of(self.updates, TokenUpdateField):
+            raise ValueError
+
         return TokenUpdate(
-            self.account.to_dict(),
-            self.token.to_dict(),
-            self.updates
+            self.account,
+            self.token,
+            list(self.updates)
         )
 
 
@@ -1842,6 +2936,8 @@ class TokenDistributionBuilder:
     able to build them with ease.
     """
 
+    __slots__ = ("program_id", "to", "amount", "token_ids", "update_fields")
+
     def __init__(self):
         self.program_id = None
         self.to = None
@@ -1853,9 +2949,6 @@ class TokenDistributionBuilder:
         """
         Sets the program_id for the TokenDistribution
         """
-        if not isinstance(program_id, AddressOrNamespace):
-            raise ValueError
-
         self.program_id = program_id
         return self
 
@@ -1863,8 +2956,6 @@ class TokenDistributionBuilder:
         """
         Sets the receiver address for this TokenDistribution
         """
-        if not isinstance(receiver, AddressOrNamespace):
-            raise ValueError
         self.to = receiver
         return self
 
@@ -1872,9 +2963,6 @@ class TokenDistributionBuilder:
         """
         Sets the amount of the token to be distributed to the receiver
         """
-        if not isinstance(amount, U256):
-            raise ValueError
-
         self.amount = amount
         return self
 
@@ -1883,9 +2971,6 @@ class TokenDistributionBuilder:
         Adds a single tokenId to the token distribution (used primarily for
         non-fungible tokens).
         """
-        if not isinstance(token_id, U256):
-            raise ValueError
-
         self.token_ids.append(token_id)
         return self
 
@@ -1893,9 +2978,6 @@ class TokenDistributionBuilder:
         """
         Adds a single update_field to the TokenDistribution
         """
-        if not isinstance(update_field, TokenUpdateField):
-            raise ValueError
-
         self.update_fields.append(update_field)
         return self
 
@@ -1903,20 +2985,14 @@ class TokenDistributionBuilder:
         """
         adds multiple token_ids to a given TokenDistribution
         """
-        if not isinstance(items, List[U256]):
-            raise ValueError
-
-        self.token_ids = self.token_ids + items
+        self.token_ids.extend(items)
         return self
 
     def extend_update_fields(self, items: List[TokenUpdateField]):
         """
         adds multiple update_fields to a single TokenDistribution
         """
-        if not isinstance(items, List[TokenUpdateField]):
-            raise ValueError
-
-        self.update_fields = self.update_fields + items
+        self.update_fields.extend(items)
         return self
 
     def build(self) -> TokenDistribution:
@@ -1936,8 +3012,8 @@ class TokenDistributionBuilder:
             self.program_id,
             self.to,
             self.amount,
-            self.token_ids,
-            self.update_fields
+            list(self.token_ids),
+            list(self.update_fields)
         )
 
 
@@ -1947,6 +3023,15 @@ class CreateInstructionBuilder:
     build properly structured CreateInstructions.
     """
 
+    __slots__ = (
+        "program_namespace",
+        "program_id",
+        "program_owner",
+        "total_supply",
+        "initialized_supply",
+        "distribution",
+    )
+
     def __init__(
         self,
     ):
@@ -1962,9 +3047,6 @@ class CreateInstructionBuilder:
         sets the address or namespace of the program for which the token
         is being created
         """
-        if not isinstance(program_namespace, AddressOrNamespace):
-            raise ValueError
-
         self.program_namespace = program_namespace
         return self
 
@@ -1974,9 +3056,6 @@ class CreateInstructionBuilder:
         redundant with the program_namespace, for factory-like contracts this
         is necessary
         """
-        if not isinstance(program_id, AddressOrNamespace):
-            raise ValueError
-
         self.program_id = program_id
         return self
 
@@ -1986,9 +3065,6 @@ class CreateInstructionBuilder:
         circumstances ownership may be handed off to a different account, such
         as an account governed by a multisig, or another program
         """
-        if not isinstance(program_owner, Address):
-            raise ValueError
-
         self.program_owner = program_owner
         return self
 
@@ -1998,9 +3074,6 @@ class CreateInstructionBuilder:
         first time. If this is used on CreateInstruction returned for a token
         that already exists, the Instruction will be considered invalid
         """
-        if not isinstance(total_supply, U256):
-            raise ValueError
-
         self.total_supply = total_supply
         return self
 
@@ -2011,9 +3084,6 @@ class CreateInstructionBuilder:
         for a token that already exists, the Instruction will be considered
         invalid
         """
-        if not isinstance(initialized_supply, U256):
-            raise ValueError
-
         self.initialized_supply = initialized_supply
         return self
 
@@ -2021,9 +3091,6 @@ class CreateInstructionBuilder:
         """
         adds a single new TokenDistribution to the CreateInstruction
         """
-        if not isinstance(token_distribution, TokenDistribution):
-            raise ValueError
-
         self.distribution.append(token_distribution)
         return self
 
@@ -2031,10 +3098,7 @@ class CreateInstructionBuilder:
         """
         adds multiple new TokenDistributions to the CreateInstruction
         """
-        if not isinstance(items, List[TokenDistribution]):
-            raise ValueError
-
-        self.distribution = self.distribution + items
+        self.distribution.extend(items)
         return self
 
     def build(self) -> CreateInstruction:
@@ -2051,7 +3115,7 @@ class CreateInstructionBuilder:
             raise ValueError
 
         if self.total_supply is None:
-            self.total_supply = 0xffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff
+            self.total_supply = U256(U256.MAX)
 
         if self.initialized_supply is None:
             self.initialized_supply = self.total_supply
@@ -2064,7 +3128,7 @@ class CreateInstructionBuilder:
                 self.program_owner,
                 self.total_supply,
                 self.initialized_supply,
-                self.distribution
+                list(self.distribution)
             )
         )
 
@@ -2075,6 +3139,8 @@ class UpdateInstructionBuilder:
     developers to build properly structured UpdateInstructions
     """
 
+    __slots__ = ("updates",)
+
     def __init__(self):
         self.updates = []
 
@@ -2082,25 +3148,19 @@ class UpdateInstructionBuilder:
         """
         adds a single TokenOrProgramUpdate to the UpdateInstruction
         """
-        if not isinstance(update, TokenOrProgramUpdate):
-            raise ValueError
-
         self.updates.append(update)
         return self
 
     def extend_updates(self, items: List[TokenOrProgramUpdate]):
 
-        if not isinstance(items, List[TokenOrProgramUpdate]):
-            raise ValueError
-
-        self.updates = self.updates + items
+        self.updates.extend(items)
         return self
 
     def build(self) -> UpdateInstruction:
         """
         converts this builder type into a properly structured UpdateInstruction
         """
-        return Instruction("update", UpdateInstruction(self.updates))
+        return Instruction("update", UpdateInstruction(list(self.updates)))
 
 
 class TransferInstructionBuilder:
@@ -2109,6 +3169,8 @@ class TransferInstructionBuilder:
     structured TransferInstructions simpler for developers
     """
 
+    __slots__ = ("token", "transfer_from", "transfer_to", "amount", "ids")
+
     def __init__(self):
         self.token = None
         self.transfer_from = None
@@ -2120,9 +3182,6 @@ class TransferInstructionBuilder:
         """
         sets the address of the token being transfered
         """
-        if not isinstance(token_address, Address):
-            raise ValueError
-
         self.token = token_address
         return self
 
@@ -2131,9 +3190,6 @@ class TransferInstructionBuilder:
         sets the address or namespace of the account the token is being
         transfered from
         """
-        if not isinstance(transfer_from, AddressOrNamespace):
-            raise ValueError
-
         self.transfer_from = transfer_from
         return self
 
@@ -2141,9 +3197,6 @@ class TransferInstructionBuilder:
         """
         sets the address or namespace of the token being transfered to
         """
-        if not isinstance(transfer_to, AddressOrNamespace):
-            raise ValueError
-
         self.transfer_to = transfer_to
         return self
 
@@ -2151,10 +3204,6 @@ class TransferInstructionBuilder:
         """
         sets the amount of the token being transferred
         """
-
-        if not isinstance(amount, U256):
-            raise ValueError
-
         self.amount = amount
         return self
 
@@ -2163,9 +3212,6 @@ class TransferInstructionBuilder:
         adds a single tokenId to the transfer instruction, typically used
         for transferring non-fungible tokens
         """
-        if not isinstance(token_id, U256):
-            raise ValueError
-
         self.ids.append(token_id)
         return self
 
@@ -2174,7 +3220,15 @@ class TransferInstructionBuilder:
         adds multiple tokenIds to the transfer instruction, typically used
         for transferring non-fungible tokens
         """
-        self.ids = self.ids + items
+        self.ids.extend(items)
+        return self
+
+    def extend_token_ids_from_bytes(self, ids_bytes: bytes):
+        """
+        adds multiple tokenIds, given as concatenated 32 byte big-endian
+        values, to the transfer instruction
+        """
+        self.ids.extend(U256.list_from_bytes(ids_bytes))
         return self
 
     def build(self) -> TransferInstruction:
@@ -2189,7 +3243,7 @@ class TransferInstructionBuilder:
                 self.transfer_from,
                 self.transfer_to,
                 self.amount,
-                self.ids
+                list(self.ids)
             )
         )
 
@@ -2200,6 +3254,15 @@ class BurnInstructionBuilder:
     BurnInstructions simple for developers
     """
 
+    __slots__ = (
+        "caller",
+        "program_id",
+        "token",
+        "burn_from",
+        "amount",
+        "token_ids",
+    )
+
     def __init__(self):
         self.caller = None
         self.program_id = None
@@ -2213,9 +3276,6 @@ class BurnInstructionBuilder:
         sets the address of the original caller of the program/function/method
         returning this instruction
         """
-        if not isinstance(caller, Address):
-            raise ValueError
-
         self.caller = caller
         return self
 
@@ -2223,9 +3283,6 @@ class BurnInstructionBuilder:
         """
         sets the program_id of the program that is returning this instruction
         """
-        if not isinstance(program_id, AddressOrNamespace):
-            raise ValueError
-
         self.program_id = program_id
         return self
 
@@ -2233,19 +3290,13 @@ class BurnInstructionBuilder:
         """
         sets the address of the token to be burned by this instruction
         """
-        if not isinstance(token_address, Address):
-            raise ValueError
-
-        self.token_address = token_address
+        self.token = token_address
         return self
 
     def set_burn_from_address(self, burn_from_address: AddressOrNamespace):
         """
         sets the address to the account from which the burn will be applied
         """
-        if not isinstance(burn_from_address, AddressOrNamespace):
-            raise ValueError
-
         self.burn_from = burn_from_address
         return self
 
@@ -2253,9 +3304,6 @@ class BurnInstructionBuilder:
         """
         sets t he amount of the token to burn
         """
-        if not isinstance(amount, U256):
-            raise ValueError
-
         self.amount = amount
         return self
 
@@ -2264,9 +3312,6 @@ class BurnInstructionBuilder:
         adds a single token id to the burn instruction, typically used
         for non-fungible tokens
         """
-        if not isinstance(token_id, U256):
-            raise ValueError
-
         self.token_ids.append(token_id)
         return self
 
@@ -2275,10 +3320,15 @@ class BurnInstructionBuilder:
         adds multiple token ids to the burn instruction, typically used for
         non-fungible tokens
         """
-        if not isinstance(items, List[U256]):
-            raise ValueError
+        self.token_ids.extend(items)
+        return self
 
-        self.token_ids = self.token_ids + items
+    def extend_token_ids_from_bytes(self, ids_bytes: bytes):
+        """
+        adds multiple token ids, given as concatenated 32 byte big-endian
+        values, to the burn instruction
+        """
+        self.token_ids.extend(U256.list_from_bytes(ids_bytes))
         return self
 
     def build(self) -> BurnInstruction:
@@ -2293,13 +3343,13 @@ class BurnInstructionBuilder:
                 self.token,
                 self.burn_from,
                 self.amount,
-                self.token_ids
+                list(self.token_ids)
             )
         )
 
 
 class LogInstructionBuilder:
-    pass
+    __slots__ = ()
 
 
 class OutputBuilder:
@@ -2308,6 +3358,8 @@ class OutputBuilder:
     LASR programs return to the LASR protocol.
     """
 
+    __slots__ = ("inputs", "instructions")
+
     def __init__(self):
         self.inputs = None
         self.instructions = []
@@ -2316,9 +3368,6 @@ class OutputBuilder:
         """
         sets the inputs provided to the program by the protocol
         """
-        if not isinstance(inputs, str):
-            raise ValueError
-
         self.inputs = inputs
         return self
 
@@ -2326,8 +3375,6 @@ class OutputBuilder:
         """
         adds a single instruction to the Output
         """
-        if not isinstance(instruction, Instruction):
-            raise ValueError
         self.instructions.append(instruction)
         return self
 
@@ -2335,13 +3382,11 @@ class OutputBuilder:
         """
         Adds multiple instructions to the Output
         """
-        if not isinstance(instructions, List[Instruction]):
-            raise ValueError
-
-        self.instructions = self.instructions + instructions
+        self.instructions.extend(instructions)
+        return self
 
     def build(self):
         """
         converts this builder type into proper Outputs
         """
-        return Outputs(self.inputs, self.instructions)
+        return Outputs(self.inputs, list(self.instructions))